@@ -1,12 +1,20 @@
-from flask import Blueprint, jsonify, request, current_app as app
+from flask import Blueprint, jsonify, current_app as app
 import discord
 from bot import logger
+from extensions.api_server import api_key_required, get_or_fetch_channel, evict_channel, get_json_body
 import config as cfg
 
 bp = Blueprint('announcements', __name__)
 
+# title prefix plus its separating space per message type
+_ANN_TITLE_PREFIX_SPC = {
+    mt: f"{conf.title_prefix} " if conf.title_prefix else ""
+    for mt, conf in cfg.ANNOUNCEMENT_TYPES.items()
+}
+
 
 @bp.route('/announcements', methods=['POST'])
+@api_key_required
 def handle_announcements():
     """Catch-all endpoint for posting announcements into Discord.
 
@@ -22,27 +30,19 @@ def handle_announcements():
     The endpoint will schedule a coroutine on the bot event loop via
     app.run_discord_op to send the message to the appropriate channel.
     """
-    # API key check
-    auth_header = request.headers.get("X-API-Key")
-    if not auth_header or auth_header != app.secret_key:
-        logger.info(f"API Access Denied: Invalid X-API-Key provided: '{auth_header}'")
-        return jsonify({"error": "Invalid X-API-Key provided"}), 401
-
-    if not request.is_json:
-        logger.info("API Access Denied: Request content type is not JSON")
+    data = get_json_body()
+    if not isinstance(data, dict):
+        logger.info("API Access Denied: Request body is not a JSON object")
         return jsonify({"error": "Request must be in JSON format"}), 400
 
-    data = request.get_json()
-    logger.info(f"API Accessed for announcement with data: {data}")
-
     required_fields = ["message_type", "title", "body"]
     for field in required_fields:
         if field not in data:
-            logger.info(f"API Access Denied: Missing required field '{field}' in request data")
+            logger.info("API Access Denied: Missing required field '%s' in request data", field)
             return jsonify({"error": f"Missing required field: {field}"}), 400
 
     message_type = data.get("message_type").lower()
-    title = data.get("title")
+    title = str(data.get("title")).strip()
     body = data.get("body")
     channel_override = data.get("channel_id")
     guild_id = data.get("guild_id")
@@ -55,12 +55,11 @@ def handle_announcements():
     dry_run = data.get("dry_run", False)
 
     # Validate message type and resolve target channel & embed properties
-    if message_type not in cfg.ANNOUNCEMENT_TYPES:
-        logger.info(f"API Access Denied: Unsupported message_type '{message_type}'")
+    announce_config = cfg.ANNOUNCEMENT_TYPES.get(message_type)
+    if announce_config is None:
+        logger.info("API Access Denied: Unsupported message_type '%s'", message_type)
         return jsonify({"error": f"Unsupported message_type: {message_type}"}), 400
 
-    announce_config = cfg.ANNOUNCEMENT_TYPES[message_type]
-
     # Resolve target channel: prefer explicit channel override, then guild-config, then announce_config
     target_channel_id = None
 
@@ -72,30 +71,23 @@ def handle_announcements():
     elif guild_id is not None:
         target_channel_id = cfg.resolve_announcement_target_channel(guild_id, message_type)
     else:
-        # No guild specified: prefer module-level channel_id in announcement type config
-        # then fallback to resolving the channel_key against the default/global guild (0)
-        channel_id_from_type = announce_config.get("channel_id")
-        if channel_id_from_type:
-            try:
-                target_channel_id = int(channel_id_from_type)
-            except Exception:
-                target_channel_id = None
-        else:
-            channel_key = announce_config.get("channel_key")
-            if channel_key:
-                try:
-                    target_channel_id = cfg.get_channel_for_guild(0, channel_key)
-                except Exception:
-                    target_channel_id = None
-
-    logger.info(f"Announcement resolution: message_type={message_type}, channel_override={channel_override}, guild_id={guild_id}, resolved_channel={target_channel_id}")
-
-    color_value = announce_config.get("color")
-    title_prefix = announce_config.get("title_prefix", "")
+        # No guild specified: resolve the type's channel_key against the default/global guild (0)
+        try:
+            target_channel_id = cfg.get_channel_for_guild(0, announce_config.channel_key)
+        except Exception:
+            target_channel_id = None
+
+    logger.info(
+        "Announcement resolution: message_type=%s, channel_override=%s, guild_id=%s, resolved_channel=%s",
+        message_type, channel_override, guild_id, target_channel_id,
+    )
+
+    color_value = announce_config.color
 
     # Build embed
     embed = discord.Embed(
-        title=f"{title_prefix} {title}".strip(),
+        # rstrip only matters for a blank title, which would leave the prefix's space behind
+        title=f"{_ANN_TITLE_PREFIX_SPC[message_type]}{title}".rstrip(),
         description=body,
         color=discord.Color(color_value) if color_value is not None else discord.Color.default()
     )
@@ -127,7 +119,7 @@ def handle_announcements():
             "event_id": event_id,
             "guild_id": guild_id,
         }
-        logger.info(f"Dry-run announcement prepared (type={message_type}): {embed_payload}")
+        logger.info("Dry-run announcement prepared (type=%s): %s", message_type, embed_payload)
         return jsonify({"status": "dry_run", "payload": embed_payload}), 200
 
     if target_channel_id is None:
@@ -135,19 +127,21 @@ def handle_announcements():
         return jsonify({"error": "Target channel could not be determined; provide channel_id or guild_id with configuration."}), 400
 
     async def _send():
-        bot = getattr(app, "bot", None)
-        if bot is None:
+        if getattr(app, "bot", None) is None:
             raise RuntimeError("Discord bot instance not available on Flask app")
 
-        channel = bot.get_channel(int(target_channel_id)) if target_channel_id is not None else None
+        # Channel lookup and send share one hop onto the bot loop; repeat
+        # posts to the same channel are served from the channel caches.
+        channel = await get_or_fetch_channel(int(target_channel_id))
         if channel is None:
-            try:
-                channel = await bot.fetch_channel(int(target_channel_id))
-            except Exception as e:
-                logger.exception(f"Failed to fetch channel {target_channel_id}: {e}")
-                raise
+            raise RuntimeError(f"Failed to fetch channel {target_channel_id}")
 
-        sent = await channel.send(embed=embed)
+        try:
+            sent = await channel.send(embed=embed)
+        except (discord.NotFound, discord.Forbidden):
+            # Don't keep serving a channel we can no longer post to
+            evict_channel(target_channel_id)
+            raise
         return sent.id
 
     try:
@@ -155,8 +149,8 @@ def handle_announcements():
         if run_op is None:
             raise RuntimeError("API server helper 'run_discord_op' not available on app; is the bot running?")
         message_id = run_op(_send())
-        logger.info(f"Posted announcement (type={message_type}) to channel {target_channel_id} as message {message_id}")
+        logger.info("Posted announcement (type=%s) to channel %s as message %s", message_type, target_channel_id, message_id)
         return jsonify({"status": "ok", "channel_id": target_channel_id, "message_id": message_id}), 200
     except Exception as e:
-        logger.exception(f"Failed to post announcement: {e}")
+        logger.exception("Failed to post announcement: %s", e)
         return jsonify({"error": "Failed to post announcement", "detail": str(e)}), 500
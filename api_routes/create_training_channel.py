@@ -163,19 +163,27 @@ def create_training_channel():
             logger.error("Student with discord id %s not found in any guild the bot is in", student_uid)
             raise RuntimeError(f"Student with discord id {student_uid} not found in any guild the bot is in")
 
-        # Resolve primary trainer and other trainers to Member objects if possible
-        async def _resolve_member(guild, uid):
-            if uid is None:
-                return None
-            m = guild.get_member(uid)
-            if m is None:
-                try:
-                    m = await guild.fetch_member(uid)
-                except Exception:
-                    m = None
-            return m
+        # Resolve primary trainer and other trainers to Member objects if possible. Cached
+        # members are used directly; cache misses are fetched with gateway queries of up to
+        # 100 ids (the query_members limit) instead of one fetch_member REST call per trainer.
+        trainer_uids = list(dict.fromkeys(uid for uid in [primary_uid, *other_uids] if uid is not None))
+        resolved = {}
+        missing = []
+        for uid in trainer_uids:
+            m = target_guild.get_member(uid)
+            if m is not None:
+                resolved[uid] = m
+            else:
+                missing.append(uid)
+        for i in range(0, len(missing), 100):
+            chunk = missing[i:i + 100]
+            try:
+                for m in await target_guild.query_members(user_ids=chunk, limit=len(chunk), cache=True):
+                    resolved[m.id] = m
+            except Exception:
+                logger.exception("Failed to query trainer members %s in guild %s", chunk, target_guild.id)
 
-        primary_member = await _resolve_member(target_guild, primary_uid)
+        primary_member = resolved.get(primary_uid) if primary_uid is not None else None
         if primary_member:
             logger.info("Resolved primary trainer to member id=%s display=%s", primary_member.id, getattr(primary_member, "display_name", None))
         else:
@@ -183,7 +191,7 @@ def create_training_channel():
 
         other_members = []
         for uid in other_uids:
-            m = await _resolve_member(target_guild, uid)
+            m = resolved.get(uid)
             if m:
                 logger.debug("Resolved other trainer uid %s to member id=%s", uid, m.id)
                 other_members.append(m)
@@ -252,12 +260,7 @@ def create_training_channel():
                 trainer_mentions.append(f"<@{primary_uid}>")
 
             for uid in other_uids:
-                # try to find resolved member in other_members matching uid
-                m_obj = None
-                for m in other_members:
-                    if getattr(m, 'id', None) == int(uid):
-                        m_obj = m
-                        break
+                m_obj = resolved.get(uid)
                 trainer_mentions.append(m_obj.mention if m_obj else f"<@{uid}>")
 
             trainers_text = ", ".join(trainer_mentions) if trainer_mentions else "(no trainers specified)"
@@ -26,12 +26,13 @@ The implementation is defensive and logs parsing failures rather than raising
 exceptions for non-fatal problems.
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, jsonify
+import asyncio
 import discord
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any
 
-from extensions.api_server import app, api_key_required
+from extensions.api_server import app, api_key_required, get_or_fetch_channel, evict_channel, get_json_body
 import config as cfg
 from utils.events import parse_position
 from utils.vatsim import parse_vatsim_logon_time
@@ -50,31 +51,31 @@ def _safe_get(d: Dict[str, Any], key: str, default=None):
     return d.get(key, default) if isinstance(d, dict) else default
 
 
-RATING_ID_TO_SHORT = {
-    -1: "INA",
-    0: "SUS",
-    1: "OBS",
-    2: "S1",
-    3: "S2",
-    4: "S3",
-    5: "C1",
-    6: "C2",
-    7: "C3",
-    8: "I1",
-    9: "I2",
-    10: "I3",
-    11: "SUP",
-    12: "ADM",
-}
-
-
-def _parse_controller_time_field(ctrl: Dict[str, Any]):
+# VATSIM controller rating ids 0..12 map to their short names by position; -1 is "INA"
+RATING_SHORT_NAMES = ("SUS", "OBS", "S1", "S2", "S3", "C1", "C2", "C3", "I1", "I2", "I3", "SUP", "ADM")
+# preformatted " (SHORT)" suffixes appended after a controller's name
+_RATING_SUFFIXES = tuple(f" ({name})" for name in RATING_SHORT_NAMES)
+
+
+def _rating_short(rating_id: int, default: str) -> str:
+    """Return the short name for a rating id, or `default` for unknown ids."""
+    if 0 <= rating_id < len(RATING_SHORT_NAMES):
+        return RATING_SHORT_NAMES[rating_id]
+    return "INA" if rating_id == -1 else default
+
+
+def _parse_controller_time_field(ctrl: Dict[str, Any], event_start=None, event_end=None):
     """Attempt to extract controller-specific start/end datetimes.
 
     The function accepts a controller mapping and looks for a variety of
     commonly used keys (signup_start, controller_final_start_time, start_time,
     etc). Returns a tuple (start_dt, end_dt) where each element is either a
     timezone-aware datetime (UTC) or None.
+
+    `event_start`/`event_end` may be (raw_value, parsed_datetime) pairs for the
+    event itself; a controller value equal to the event's raw value reuses the
+    already-parsed datetime instead of being parsed again (the common case when
+    a controller is signed up for the whole event).
     """
     if not isinstance(ctrl, dict):
         return None, None
@@ -109,9 +110,11 @@ def _parse_controller_time_field(ctrl: Dict[str, Any]):
             end_val = ctrl[k]
             break
 
-    def _parse(val):
+    def _parse(val, known):
         if val is None:
             return None
+        if known is not None and val == known[0]:
+            return known[1]
         try:
             if isinstance(val, datetime):
                 dt = val
@@ -126,7 +129,7 @@ def _parse_controller_time_field(ctrl: Dict[str, Any]):
             logger.debug("Failed to parse controller time value", exc_info=True, extra={"value": val})
             return None
 
-    return _parse(start_val), _parse(end_val)
+    return _parse(start_val, event_start), _parse(end_val, event_end)
 
 
 def _format_controller_time_span(cs: datetime | None, ce: datetime | None):
@@ -207,7 +210,7 @@ def post_event_position_posting():
       - 4xx for invalid input or missing configuration
       - 500 for unexpected failures while posting
     """
-    data = request.get_json(silent=True)
+    data = get_json_body()
     if not data:
         logger.warning("Invalid or missing JSON payload in /event_position_posting POST")
         return jsonify({"error": "Invalid or missing JSON payload"}), 400
@@ -281,9 +284,9 @@ def post_event_position_posting():
         buffer_start = None
         buffer_end = None
 
-    post_conf = cfg.ANNOUNCEMENT_TYPES.get("event-position-posting", {})
-    color_val = post_conf.get("color")
-    title_prefix = post_conf.get("title_prefix", "Event Posting:")
+    post_conf = cfg.ANNOUNCEMENT_TYPES["event-position-posting"]
+    color_val = post_conf.color
+    title_prefix = post_conf.title_prefix
 
     guild_id = _safe_get(data, "guild_id")
     target_channel_id = None
@@ -397,45 +400,72 @@ def post_event_position_posting():
         except Exception:
             return None
 
-    def _validate_discord_id(uid: int, guild_id_val: Any) -> bool:
+    def _validate_discord_ids(uids, guild_id_val: Any) -> set:
+        """Return the subset of `uids` that resolve to a guild member or Discord user.
+
+        All lookups run inside a single coroutine so the whole batch costs one
+        round-trip onto the bot's event loop. Uncached members are resolved with
+        batched gateway queries and the remaining ids with concurrent user fetches;
+        a failed lookup only drops that id.
+        """
         run_op = getattr(app, "run_discord_op", None)
-        if run_op is None:
-            return False
+        if run_op is None or not uids:
+            return set()
 
-        async def _fetch():
+        async def _fetch_all():
             bot = getattr(app, "bot", None)
             if bot is None:
-                return False
-            try:
-                if guild_id_val is not None:
-                    try:
-                        g = bot.get_guild(int(guild_id_val))
-                    except Exception:
-                        g = None
-                    if g is not None:
-                        m = g.get_member(int(uid))
-                        if m is not None:
-                            return True
-                        try:
-                            m = await g.fetch_member(int(uid))
-                            if m is not None:
-                                return True
-                        except Exception:
-                            pass
+                return set()
+            g = None
+            if guild_id_val is not None:
                 try:
-                    user = await bot.fetch_user(int(uid))
-                    if user is not None:
-                        return True
+                    g = bot.get_guild(int(guild_id_val))
                 except Exception:
-                    return False
-            except Exception:
-                return False
-            return False
+                    g = None
+            pending = {}
+            for uid in uids:
+                try:
+                    pending[int(uid)] = uid
+                except (TypeError, ValueError):
+                    continue
+            valid = set()
+            if g is not None:
+                for iid in list(pending):
+                    if g.get_member(iid) is not None:
+                        valid.add(pending.pop(iid))
+                missing = list(pending)
+                # query_members accepts at most 100 user ids per request
+                for i in range(0, len(missing), 100):
+                    chunk = missing[i:i + 100]
+                    try:
+                        for m in await g.query_members(user_ids=chunk, limit=len(chunk), cache=True):
+                            if m.id in pending:
+                                valid.add(pending.pop(m.id))
+                    except Exception:
+                        logger.debug("Failed to query guild members for mention validation", exc_info=True, extra={"guild_id": guild_id_val})
+            if pending:
+                remaining = list(pending)
+                results = await asyncio.gather(*(bot.fetch_user(iid) for iid in remaining), return_exceptions=True)
+                for iid, res in zip(remaining, results):
+                    if res is not None and not isinstance(res, BaseException):
+                        valid.add(pending[iid])
+            return valid
 
         try:
-            return bool(run_op(_fetch()))
+            return set(run_op(_fetch_all()))
         except Exception:
-            return False
+            return set()
+
+    bot_available = getattr(app, "run_discord_op", None) is not None and getattr(app, "bot", None) is not None
+    valid_uids = set()
+    if bot_available:
+        candidate_uids = set()
+        for c in controllers:
+            if isinstance(c, dict) and _safe_get(c, "controller_final_position"):
+                uid = _get_discord_id_from_controller(c)
+                if uid is not None:
+                    candidate_uids.add(uid)
+        valid_uids = _validate_discord_ids(candidate_uids, guild_id)
 
     for c in controllers:
         if not isinstance(c, dict):
@@ -455,39 +485,28 @@ def post_event_position_posting():
         configured_name = _safe_get(c, "controller_name") or "(Unnamed)"
         display_name = configured_name
         uid = _get_discord_id_from_controller(c)
-        if uid is not None:
-            try:
-                run_op = getattr(app, "run_discord_op", None)
-                bot_obj = getattr(app, "bot", None)
-                bot_available = run_op is not None and bot_obj is not None
-                if bot_available:
-                    if _validate_discord_id(uid, guild_id):
-                        display_name = f"<@{uid}>"
-                else:
-                    display_name = f"<@{uid}>"
-            except Exception:
-                logger.debug("Failed to resolve/validate discord id for controller; using configured name", exc_info=True, extra={"controller": c})
+        if uid is not None and (uid in valid_uids or not bot_available):
+            display_name = f"<@{uid}>"
 
         rating = _safe_get(c, "controller_rating")
         rating_str = ""
-        if rating is not None:
+        rating_suffix = ""
+        if isinstance(rating, int) and 0 <= rating < len(_RATING_SUFFIXES):
+            rating_suffix = _RATING_SUFFIXES[rating]
+        elif rating is not None:
             try:
                 if isinstance(rating, int):
-                    rating_str = RATING_ID_TO_SHORT.get(rating, str(rating))
+                    rating_str = _rating_short(rating, str(rating))
                 else:
                     rs = str(rating).strip()
                     if rs.lstrip("+-").isdigit():
                         try:
                             rid = int(rs)
-                            rating_str = RATING_ID_TO_SHORT.get(rid, rs)
+                            rating_str = _rating_short(rid, rs)
                         except Exception:
                             rating_str = rs.upper()
                     else:
-                        up = rs.upper()
-                        if up in set(RATING_ID_TO_SHORT.values()):
-                            rating_str = up
-                        else:
-                            rating_str = up
+                        rating_str = rs.upper()
             except Exception:
                 logger.debug("Failed to normalize controller rating", exc_info=True, extra={"rating": rating})
                 rating_str = str(rating)
@@ -495,7 +514,7 @@ def post_event_position_posting():
         # Ensure marker_tag exists even if controller time parsing fails
         marker_tag = ""
         try:
-            cs, ce = _parse_controller_time_field(c)
+            cs, ce = _parse_controller_time_field(c, (start_time, sdt), (end_time, edt))
 
             # Determine whether to show controller-specific times. Preserve
             # previous behavior (show when different from event times) but also
@@ -546,16 +565,11 @@ def post_event_position_posting():
 
         # Build display name and put marker after the rating
         if rating_str:
-            name_and_rating = f"{display_name} ({rating_str})"
-        else:
-            name_and_rating = f"{display_name}"
+            rating_suffix = f" ({rating_str})"
 
         marker_display = f" — ({marker_tag})" if marker_tag else ""
 
-        if rating_str:
-            line = f"{name_and_rating}{marker_display} — {final_pos}{time_suffix}"
-        else:
-            line = f"{name_and_rating}{marker_display} — {final_pos}{time_suffix}"
+        line = f"{display_name}{rating_suffix}{marker_display} — {final_pos}{time_suffix}"
 
         category_groups.setdefault(category, []).append(line)
 
@@ -651,194 +665,125 @@ def post_event_position_posting():
             logger.error("API server helper 'run_discord_op' not available on app; is the bot running?")
             raise RuntimeError("API server helper 'run_discord_op' not available on app; is the bot running?")
 
+        # Mention text and the prior posting were already resolved for the preview above
+        mention_text = mention_text_preview
+        if not ping_users:
+            logger.info("ping_users is False: will not send mention text; will delete prior mention message if present", extra={"event_id": event_id})
+        prev_chan = existing_entry.get("channel_id") if existing_entry else None
+        prev_msg = existing_entry.get("message_id") if existing_entry else None
+        prev_mention = existing_entry.get("mention_message_id") if existing_entry else None
+
         logger.info("Posting embed to Discord", extra={"event_id": event_id, "target_channel_id": target_channel_id})
 
         async def _send_embed():
+            """Send the embed; its id is handed back before any follow-up work so it always gets persisted."""
             bot = getattr(app, "bot", None)
             if bot is None:
-                logger.error("Discord bot instance not available on Flask app during _send")
+                logger.error("Discord bot instance not available on Flask app during _send_embed")
                 raise RuntimeError("Discord bot instance not available on Flask app")
 
-            if target_channel_id is None:
-                logger.error("Attempted to send without a target_channel_id", extra={"event_id": event_id})
-                raise RuntimeError("No target channel specified for posting")
-
-            channel = bot.get_channel(int(target_channel_id)) if target_channel_id is not None else None
+            channel = await get_or_fetch_channel(int(target_channel_id))
             if channel is None:
-                try:
-                    channel = await bot.fetch_channel(int(target_channel_id))
-                except Exception as e:
-                    logger.exception("Failed to fetch channel inside _send", exc_info=True, extra={"target_channel_id": target_channel_id})
-                    raise RuntimeError(f"Failed to fetch channel {target_channel_id}: {e}")
+                logger.error("Failed to fetch channel inside _send_embed", extra={"target_channel_id": target_channel_id})
+                raise RuntimeError(f"Failed to fetch channel {target_channel_id}")
 
             icon_url = None
-            try:
-                if guild_id is not None:
-                    try:
-                        g = bot.get_guild(int(guild_id))
-                    except Exception:
-                        g = None
-                    if g is not None:
-                        icon = getattr(g, "icon", None)
-                        if icon:
-                            try:
-                                icon_url = icon.url
-                            except Exception:
-                                icon_url = None
-            except Exception:
-                icon_url = None
+            if guild_id is not None:
+                try:
+                    g = bot.get_guild(int(guild_id))
+                    icon = getattr(g, "icon", None) if g is not None else None
+                    icon_url = icon.url if icon else None
+                except Exception:
+                    icon_url = None
 
             try:
                 embed.set_footer(text="vZDC", icon_url=icon_url)
             except Exception:
                 pass
 
-            sent = await channel.send(embed=embed)
-            return getattr(sent, "id", None)
-
-        message_id = run_op(_send_embed())
-        logger.info("Posted event embed to Discord", extra={"event_id": event_id, "message_id": message_id, "target_channel_id": target_channel_id})
-
-        # Prepare mention text (space-separated mentions) from controllers list
-        mention_uids = []
-        for c in controllers:
             try:
-                uid = _get_discord_id_from_controller(c)
-                if uid is not None:
-                    mention_uids.append(int(uid))
-            except Exception:
-                continue
-        # If ping_users is False we still attempt to delete any prior mention message but do not send new mention content.
-        mention_text = " ".join(f"<@{u}>" for u in mention_uids) if mention_uids and ping_users else ""
-        if not ping_users:
-            logger.info("ping_users is False: will not send mention text; will delete prior mention message if present", extra={"event_id": event_id})
+                sent = await channel.send(embed=embed)
+            except (discord.NotFound, discord.Forbidden):
+                # Don't keep serving a channel we can no longer post to
+                evict_channel(target_channel_id)
+                raise
+            return getattr(sent, "id", None)
 
-        # Attempt to update previous mention message when replacing existing posting, otherwise send a new message
-        mention_message_id = None
-        try:
-            key = make_event_key(event_id, event_name, guild_id)
-            guild_key = guild_id if guild_id is not None else None
-            log = load_log(guild_key) or {}
-            existing = log.get(key)
+        async def _follow_up():
+            """Refresh the mention message and remove the previous posting in one hop; never fatal."""
+            channel = await get_or_fetch_channel(int(target_channel_id))
 
-            async def _send_or_update_mentions(prev_chan=None, prev_mention_id=None):
-                bot = getattr(app, "bot", None)
-                if bot is None:
-                    return None
+            async def _delete(ch, mid):
                 try:
-                    ch = bot.get_channel(int(target_channel_id)) if target_channel_id is not None else None
-                    if ch is None:
-                        ch = await bot.fetch_channel(int(target_channel_id))
+                    old = await ch.fetch_message(int(mid))
+                except Exception:
+                    return False
+                await old.delete()
+                return True
 
-                    # If there is a previous mention message in the same channel, delete it first so a fresh
-                    # message will generate new notification pings when we send.
-                    if prev_mention_id and prev_chan == target_channel_id:
+            # Delete the previous mention message first so the fresh one generates new notification pings
+            mention_message_id = None
+            prev_mention_deleted = False
+            try:
+                if channel is not None:
+                    if prev_mention and prev_chan == target_channel_id:
                         try:
-                            old = await ch.fetch_message(int(prev_mention_id))
+                            prev_mention_deleted = await _delete(channel, prev_mention)
                         except Exception:
-                            old = None
-                        if old:
-                            try:
-                                await old.delete()
-                            except Exception:
-                                pass
-
-                    # Send a fresh mention message (outside embed) so Discord will ping users anew
+                            pass
                     if mention_text:
-                        sent_m = await ch.send(content=mention_text)
-                        return getattr(sent_m, "id", None)
-                    return None
+                        sent_m = await channel.send(content=mention_text)
+                        mention_message_id = getattr(sent_m, "id", None)
+            except Exception:
+                mention_message_id = None
+
+            if prev_chan and prev_msg:
+                logger.info("Found existing posting for event; attempting to delete previous message", extra={"prev_channel": prev_chan, "prev_msg": prev_msg})
+                try:
+                    prev_channel = await get_or_fetch_channel(int(prev_chan))
+                    if prev_channel is None:
+                        raise RuntimeError(f"Failed to fetch channel {prev_chan}")
+                    if await _delete(prev_channel, prev_msg):
+                        logger.info("Deleted previous event posting message", extra={"prev_channel": prev_chan, "prev_msg": prev_msg})
+                    else:
+                        logger.debug("Failed to fetch previous message; it may already be deleted", extra={"prev_channel": prev_chan, "prev_msg": prev_msg})
+                    if prev_mention and not prev_mention_deleted and await _delete(prev_channel, prev_mention):
+                        logger.info("Deleted previous mention message", extra={"prev_channel": prev_chan, "prev_mention": prev_mention})
                 except Exception:
-                    return None
+                    logger.debug("Error while trying to delete previous message", exc_info=True, extra={"prev_channel": prev_chan, "prev_msg": prev_msg})
 
-            prev_mention = None
-            prev_chan = None
-            if existing:
-                prev_mention = existing.get("mention_message_id")
-                prev_chan = existing.get("channel_id")
+            return mention_message_id
 
-            try:
-                mention_message_id = run_op(_send_or_update_mentions(prev_chan=prev_chan, prev_mention_id=prev_mention))
-            except Exception:
-                mention_message_id = None
+        message_id = run_op(_send_embed())
+        logger.info("Posted event embed to Discord", extra={"event_id": event_id, "message_id": message_id, "target_channel_id": target_channel_id})
+
+        # The embed is live from here on: follow-up failures (including a timeout) must not lose its id
+        try:
+            mention_message_id = run_op(_follow_up())
         except Exception:
+            logger.warning("Mention refresh / previous posting cleanup failed", exc_info=True, extra={"event_id": event_id})
             mention_message_id = None
 
-        # After successful post, persist the posting and delete any previous posting for same event
+        # record new entry including mention_message_id and update count + last_updated
+        entry = {
+            "event_title": event_name,
+            "event_id": event_id,
+            "guild_id": guild_id,
+            "channel_id": target_channel_id,
+            "message_id": message_id,
+            "mention_message_id": mention_message_id,
+            "ping_users": ping_users,
+            "last_updated": datetime.now(timezone.utc).isoformat(),
+        }
         try:
-            key = make_event_key(event_id, event_name, guild_id)
-            guild_key = guild_id if guild_id is not None else None
+            # Re-read so a posting saved by a concurrent request while we were on Discord isn't overwritten
             log = load_log(guild_key) or {}
-
-            existing = log.get(key)
-            if existing:
-                prev_chan = existing.get("channel_id")
-                prev_msg = existing.get("message_id")
-                prev_mention = existing.get("mention_message_id")
-                if prev_chan and prev_msg:
-                    logger.info("Found existing posting for event; attempting to delete previous message", extra={"prev_channel": prev_chan, "prev_msg": prev_msg})
-                    async def _delete_prev():
-                        try:
-                            bot = getattr(app, "bot", None)
-                            if bot is None:
-                                logger.debug("Bot missing when attempting to delete previous message")
-                                return False
-                            try:
-                                channel = bot.get_channel(int(prev_chan)) if prev_chan is not None else None
-                                if channel is None:
-                                    channel = await bot.fetch_channel(int(prev_chan))
-                                try:
-                                    msg = await channel.fetch_message(int(prev_msg))
-                                except Exception:
-                                    logger.debug("Failed to fetch previous message; it may already be deleted", extra={"prev_channel": prev_chan, "prev_msg": prev_msg})
-                                    msg = None
-                                if msg:
-                                    await msg.delete()
-                                    logger.info("Deleted previous event posting message", extra={"prev_channel": prev_chan, "prev_msg": prev_msg})
-                                # Attempt to delete previous mention message if present
-                                if prev_mention:
-                                    try:
-                                        m = await channel.fetch_message(int(prev_mention))
-                                    except Exception:
-                                        m = None
-                                    if m:
-                                        await m.delete()
-                                        logger.info("Deleted previous mention message", extra={"prev_channel": prev_chan, "prev_mention": prev_mention})
-                                return True
-                            except Exception:
-                                logger.debug("Error while trying to delete previous message", exc_info=True, extra={"prev_channel": prev_chan, "prev_msg": prev_msg})
-                                return False
-                        except Exception:
-                            logger.debug("Unexpected error in _delete_prev", exc_info=True)
-                            return False
-
-                    try:
-                        run_op(_delete_prev())
-                    except Exception:
-                        logger.debug("run_op failed when attempting to delete previous message", exc_info=True)
-                        pass
-
-            # record new entry including mention_message_id and update count + last_updated
-            entry = {
-                "event_title": event_name,
-                "event_id": event_id,
-                "guild_id": guild_id,
-                "channel_id": target_channel_id,
-                "message_id": message_id,
-                "mention_message_id": mention_message_id,
-                "ping_users": ping_users,
-                "last_updated": datetime.now(timezone.utc).isoformat(),
-            }
             log[key] = entry
-            try:
-                save_log(guild_key, log)
-                logger.info("Persisted posting to event log", extra={"key": key, "guild_key": guild_key})
-            except Exception:
-                logger.warning("Failed to persist posting log", exc_info=True, extra={"key": key, "guild_key": guild_key})
-                return jsonify({"status": "ok", "channel_id": target_channel_id, "message_id": message_id, "mention_message_id": mention_message_id, "warning": "failed to persist posting log"}), 200
+            save_log(guild_key, log)
+            logger.info("Persisted posting to event log", extra={"key": key, "guild_key": guild_key})
         except Exception:
-            logger.debug("Error while handling posting log; continuing (non-fatal)", exc_info=True)
-            return jsonify({"status": "ok", "channel_id": target_channel_id, "message_id": message_id, "mention_message_id": mention_message_id}), 200
+            logger.warning("Failed to persist posting log", exc_info=True, extra={"key": key, "guild_key": guild_key})
+            return jsonify({"status": "ok", "channel_id": target_channel_id, "message_id": message_id, "mention_message_id": mention_message_id, "warning": "failed to persist posting log"}), 200
 
         return jsonify({"status": "ok", "channel_id": target_channel_id, "message_id": message_id, "mention_message_id": mention_message_id}), 200
     except Exception as e:
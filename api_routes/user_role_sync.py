@@ -1,5 +1,6 @@
 from flask import Blueprint, request, jsonify
 from extensions.api_server import app, api_key_required
+from bot import logger
 
 bp = Blueprint("user_role_sync", __name__, url_prefix="/user_role_sync")
 
@@ -9,4 +10,4 @@ def user_role_sync():
     """Endpoint to sync user roles based on provided data."""
 
     data = request.get_json(silent=True)
-    print(data)
\ No newline at end of file
+    logger.debug("User role sync payload: %s", data)
\ No newline at end of file
@@ -1,19 +1,379 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, jsonify
+import base64
+import heapq
 import discord
-from typing import Dict, Any
-import os
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from io import BytesIO
+from math import ceil
+from typing import Dict, Any, Optional
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timezone
 from utils.vatsim import parse_vatsim_logon_time
-from extensions.api_server import app, api_key_required
+from extensions.api_server import app, api_key_required, get_or_fetch_channel, evict_channel, get_json_body
 import config as cfg
 
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    _FONT = ImageFont.load_default()
+except Exception:
+    Image = ImageDraw = ImageFont = _FONT = None
+
+try:
+    import pyvips  # optional: faster decode+resize for banner montages
+except Exception:
+    pyvips = None
+
 bp = Blueprint("weekly_event_reminder", __name__, url_prefix="/weekly_event_reminder")
 
+logger = logging.getLogger(__name__)
+
+# Shared HTTP session for banner downloads so keep-alive connections (and their TLS
+# handshakes) are reused across events and requests.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=3))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=3))
+
+# Banners are downloaded concurrently so a reminder costs roughly one round-trip rather
+# than one per event.
+_BANNER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="banner-fetch")
+
 
 def _safe_get(d: Dict[str, Any], key: str, default=None):
     return d.get(key, default) if isinstance(d, dict) else default
 
 
+# Montage settings
+_THUMB_W = 320
+_THUMB_H = 180
+_MONTAGE_COLS = 3
+
+# Finished montages are cached for this many seconds, so retries and recurring events
+# skip the download/decode/resize/encode pipeline.
+_BANNER_CACHE_TTL = 6 * 3600
+
+
+def _banner_cache_bucket() -> int:
+    """Cache-key component that rolls over every _BANNER_CACHE_TTL seconds."""
+    return int(time.time() // _BANNER_CACHE_TTL)
+
+
+# Banners larger than this are skipped rather than buffered and decoded.
+_MAX_BANNER_BYTES = 8 * 1024 * 1024
+
+
+def _download_banner(url: str) -> bytes:
+    # Raises on failure, including for banners over _MAX_BANNER_BYTES.
+    with _SESSION.get(url, timeout=(5, 30), stream=True) as resp:
+        resp.raise_for_status()
+        declared = resp.headers.get("Content-Length")
+        if declared and declared.isdigit() and int(declared) > _MAX_BANNER_BYTES:
+            raise ValueError(f"banner too large ({declared} bytes)")
+        buf = bytearray()
+        for chunk in resp.iter_content(chunk_size=64 * 1024):
+            buf += chunk
+            if len(buf) > _MAX_BANNER_BYTES:
+                raise ValueError("banner too large")
+    return bytes(buf)
+
+
+def _fetch_banner(url: str) -> Optional[bytes]:
+    """Download a banner image; returns None on any failure."""
+    try:
+        return _download_banner(url)
+    except Exception:
+        return None
+
+
+def _build_placeholder() -> Optional[bytes]:
+    """Render the "No banners available" slot image; None if Pillow is unavailable."""
+    if Image is None:
+        return None
+    try:
+        # single placeholder image sized for one thumbnail slot
+        placeholder = Image.new("RGB", (_THUMB_W, _THUMB_H), (40, 40, 40))
+        draw = ImageDraw.Draw(placeholder)
+        msg = "No banners available"
+        left, top, right, bottom = draw.textbbox((0, 0), msg, font=_FONT)
+        text_w, text_h = right - left, bottom - top
+        draw.text(((_THUMB_W - text_w) / 2, (_THUMB_H - text_h) / 2), msg, fill=(200, 200, 200), font=_FONT)
+        bio = BytesIO()
+        placeholder.save(bio, format="PNG")
+        return bio.getvalue()
+    except Exception:
+        return None
+
+
+# Built once at import: the placeholder used when a chunk has no usable banners, and a
+# 1x1 transparent PNG that guarantees an image attachment even without Pillow.
+_PLACEHOLDER_PNG: Optional[bytes] = _build_placeholder()
+_FALLBACK_PNG: bytes = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMAASsJTYQAAAAA"
+    "SUVORK5CYII="
+)
+
+
+def _montage_vips(raws: list) -> Optional[bytes]:
+    """Tile banner bytes with libvips (fused decode + resize); None if nothing decodes."""
+    thumbs = []
+    for raw in raws:
+        try:
+            thumb = pyvips.Image.thumbnail_buffer(raw, _THUMB_W, height=_THUMB_H)
+            if thumb.hasalpha():
+                thumb = thumb.flatten(background=[40, 40, 40])
+            thumb = thumb.colourspace("srgb")
+            # centre in its slot, matching the Pillow layout
+            thumbs.append(thumb.gravity("centre", _THUMB_W, _THUMB_H, extend="background", background=[40, 40, 40]))
+        except Exception:
+            continue
+    if not thumbs:
+        return None
+    cols_use = min(_MONTAGE_COLS, len(thumbs))
+    montage = pyvips.Image.arrayjoin(thumbs, across=cols_use, background=[40, 40, 40])
+    return montage.write_to_buffer(".webp[Q=82]")
+
+
+def _montage_pillow(raws: list) -> Optional[bytes]:
+    """Tile banner bytes with Pillow; None if nothing decodes."""
+    if Image is None:
+        return None
+
+    imgs = []
+    for raw in raws:
+        try:
+            im = Image.open(BytesIO(raw))
+            # For JPEGs, let the decoder downscale by 1/2..1/8 while decoding instead of
+            # materialising the full-resolution bitmap only to shrink it afterwards.
+            im.draft("RGB", (_THUMB_W, _THUMB_H))
+            imgs.append(im.convert("RGB"))
+        except Exception:
+            continue
+    if not imgs:
+        return None
+
+    # compute grid size
+    count = len(imgs)
+    cols_use = min(_MONTAGE_COLS, count)
+    rows = ceil(count / cols_use)
+    canvas_w = cols_use * _THUMB_W
+    canvas_h = rows * _THUMB_H
+    montage = Image.new("RGB", (canvas_w, canvas_h), (40, 40, 40))
+
+    for idx, im in enumerate(imgs):
+        # resize/crop to thumbnail area while preserving aspect
+        im_thumb = im.copy()
+        im_thumb.thumbnail((_THUMB_W, _THUMB_H), Image.LANCZOS)
+        # paste centered in slot
+        row = idx // cols_use
+        col = idx % cols_use
+        x = col * _THUMB_W + (_THUMB_W - im_thumb.width) // 2
+        y = row * _THUMB_H + (_THUMB_H - im_thumb.height) // 2
+        montage.paste(im_thumb, (x, y))
+
+    bio = BytesIO()
+    montage.save(bio, format="WEBP", quality=82, method=4)
+    return bio.getvalue()
+
+
+def _tile_montage(raws: list) -> Optional[bytes]:
+    """Tile downloaded banners into a WebP montage with pyvips, falling back to Pillow."""
+    montage_bytes = None
+    if pyvips is not None:
+        try:
+            montage_bytes = _montage_vips(raws)
+        except Exception:
+            logger.exception("pyvips montage failed; falling back to Pillow")
+    if montage_bytes is None:
+        montage_bytes = _montage_pillow(raws)
+    return montage_bytes
+
+
+class _PartialBanners(Exception):
+    """Some banners failed to download; carries the ones that did so they aren't fetched twice."""
+
+    def __init__(self, raws: list):
+        super().__init__("some banners failed to download")
+        self.raws = raws
+
+
+@lru_cache(maxsize=64)
+def _cached_montage(urls: tuple, cache_bucket: int) -> bytes:
+    # Only complete montages are cached: anything short of every banner raises, and
+    # lru_cache does not memoise exceptions.
+    raws = [raw for raw in _BANNER_POOL.map(_fetch_banner, urls) if raw]
+    if len(raws) != len(urls):
+        raise _PartialBanners(raws)
+    montage_bytes = _tile_montage(raws)
+    if not montage_bytes:
+        raise ValueError("no usable banners")
+    return montage_bytes
+
+
+def _build_montage(urls: tuple, cache_bucket: int) -> bytes:
+    """Download `urls` in parallel and tile them into a WebP montage.
+
+    Uses pyvips when installed and falls back to Pillow. Montages built from every banner
+    are cached per (ordered) URL tuple and cache bucket; when a download fails the montage
+    is built from the rest but not cached, so the next request retries the missing ones.
+    Raises ValueError when none of the banners are usable.
+    """
+    try:
+        return _cached_montage(urls, cache_bucket)
+    except _PartialBanners as exc:
+        raws = exc.raws
+    montage_bytes = _tile_montage(raws) if raws else None
+    if not montage_bytes:
+        raise ValueError("no usable banners")
+    return montage_bytes
+
+
+def _parse_event_time(val) -> Optional[datetime]:
+    """Parse a VATSIM-style timestamp (or pass through a datetime) as an aware UTC datetime."""
+    try:
+        dt = parse_vatsim_logon_time(val) if isinstance(val, str) and val else (val if isinstance(val, datetime) else None)
+    except Exception:
+        return None
+    if isinstance(dt, datetime) and dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+@dataclass(slots=True)
+class StoredEvent:
+    """A single event from the reminder payload, normalised once at ingest.
+
+    Raw `start`/`end` values are kept alongside the parsed datetimes so they can still
+    be displayed when they don't parse.
+    """
+    event_id: str
+    name: str
+    description: str
+    start: Any
+    end: Any
+    start_dt: Optional[datetime]
+    end_dt: Optional[datetime]
+    banner_url: Optional[str]
+    ev_type: str
+    host: str
+    featured: list
+    url: str
+    expires_at: float = 0.0
+
+    @classmethod
+    def from_payload(cls, ev: Dict[str, Any], expires_at: float = 0.0) -> "StoredEvent":
+        raw_id = _safe_get(ev, "event_id")
+        event_id = str(raw_id).strip() if raw_id else ""
+        start = _safe_get(ev, "event_start_time") or ""
+        end = _safe_get(ev, "event_end_time") or ""
+        return cls(
+            event_id=event_id,
+            name=_safe_get(ev, "event_name") or "",
+            description=_safe_get(ev, "event_description") or "",
+            start=start,
+            end=end,
+            start_dt=_parse_event_time(start),
+            end_dt=_parse_event_time(end),
+            banner_url=_safe_get(ev, "event_banner_url"),
+            ev_type=_safe_get(ev, "event_type") or "",
+            host=_safe_get(ev, "event_host") or "",
+            featured=_safe_get(ev, "event_feature_fields") or [],
+            url=f"https://vzdc.org/events/{event_id}" if event_id else "",
+            expires_at=expires_at,
+        )
+
+
+# Embed styling for the "event-reminder" announcement type, resolved once at import.
+_REMINDER_CONF = cfg.ANNOUNCEMENT_TYPES["event-reminder"]
+_REMINDER_TITLE = f"{_REMINDER_CONF.title_prefix} Weekly Events"
+_REMINDER_COLOR = _REMINDER_CONF.color
+
+_MAX_FIELD_NAME = 256
+_MAX_FIELD_VALUE = 1024
+
+
+@lru_cache(maxsize=1024)
+def _event_field(url, name, description, start, end, start_dt, end_dt, ev_type, host, featured) -> tuple:
+    """Render the (name, value) embed field for one event.
+
+    Pure function of its (hashable) arguments so the same event reposted across
+    retries or weekly runs is formatted once.
+    """
+    name = name or "(Unnamed event)"
+
+    # times
+    if start_dt and end_dt:
+        times = f" — <t:{int(start_dt.timestamp())}:F> to <t:{int(end_dt.timestamp())}:F>"
+    elif start_dt:
+        times = f" — <t:{int(start_dt.timestamp())}:F>"
+    elif end_dt:
+        times = f" — <t:{int(end_dt.timestamp())}:F>"
+    elif start and end:
+        times = f" — {start} to {end} (UTC)"
+    elif start:
+        times = f" — starts {start} (UTC)"
+    else:
+        times = ""
+
+    field_name = f"{name}{times}"
+    if len(field_name) > _MAX_FIELD_NAME:
+        field_name = field_name[: (_MAX_FIELD_NAME - 4)] + "..."
+
+    parts = [description or "(No description)"]
+    meta = []
+    if ev_type:
+        meta.append(f"Type: {ev_type}")
+    if host:
+        meta.append(f"Host: {host}")
+    if meta:
+        parts.append(" • ".join(meta))
+    if featured:
+        parts.append("Featured: " + ", ".join(featured))
+    if url:
+        parts.append(f"[Event Page]({url})")
+
+    value = "\n".join(parts)
+    if len(value) > (_MAX_FIELD_VALUE - 4):
+        value = value[: (_MAX_FIELD_VALUE - 7)] + "..."
+
+    return field_name, value
+
+
+def _make_field_for_event(se: StoredEvent) -> tuple:
+    featured = se.featured
+    if isinstance(featured, list) and all(isinstance(x, str) for x in featured):
+        featured = tuple(featured)
+    else:
+        featured = ()
+    args = (se.url, se.name, se.description, se.start, se.end, se.start_dt, se.end_dt, se.ev_type, se.host, featured)
+    try:
+        return _event_field(*args)
+    except TypeError:
+        # unhashable raw values in the payload; format without caching
+        return _event_field.__wrapped__(*args)
+
+
+# app.event_store_heap holds (expires_at, event_id) pairs so expired entries can be
+# dropped from app.event_store without scanning it. Guarded by _EVENT_STORE_LOCK since
+# waitress serves requests on several threads.
+_EVENT_STORE_LOCK = threading.Lock()
+
+
+def _purge_expired_events(now_ts: float) -> None:
+    """Pop expired heap heads and drop their event_store entries (caller holds the lock)."""
+    heap = app.event_store_heap
+    while heap and heap[0][0] <= now_ts:
+        _, event_id = heapq.heappop(heap)
+        entry = app.event_store.get(event_id)
+        # the id may have been re-stored with a later expiry since this heap entry was pushed
+        if entry is not None and entry.expires_at <= now_ts:
+            del app.event_store[event_id]
+
+
 @bp.route("", methods=["POST"])  # POST /regular_event_reminder
 @api_key_required
 def post_weekly_event_reminder():
@@ -21,7 +381,7 @@ def post_weekly_event_reminder():
 
     Expected JSON shape includes either `guild_id` or `channel_id` to determine where the message should be posted.
     """
-    data = request.get_json(silent=True)
+    data = get_json_body()
     if not data:
         return jsonify({"error": "Invalid or missing JSON payload"}), 400
 
@@ -48,263 +408,134 @@ def post_weekly_event_reminder():
             app.event_store = {}
     except Exception:
         app.event_store = {}
-
-    # TTL for stored events in seconds (default 24 hours). Can be overridden with EVENT_STORE_TTL env var.
-    EVENT_STORE_TTL = int(os.getenv("EVENT_STORE_TTL", "86400"))
-
-    now_ts = datetime.now(timezone.utc).timestamp()
-    for ev in events:
-        ev_id = _safe_get(ev, "event_id")
-        if ev_id:
-            try:
-                key = str(ev_id).strip()
-                app.event_store[key] = {
-                    "event": ev,
-                    "expires_at": now_ts + EVENT_STORE_TTL,
-                }
-            except Exception:
-                # ignore failures to store event (non-critical)
-                pass
+    if not isinstance(getattr(app, "event_store_heap", None), list):
+        app.event_store_heap = []
+
+    # TTL for stored events comes from cfg.EVENT_STORE_TTL (EVENT_STORE_TTL env var)
+    now_ts = time.time()
+    stored_events = [StoredEvent.from_payload(ev, now_ts + cfg.EVENT_STORE_TTL) for ev in events]
+    with _EVENT_STORE_LOCK:
+        _purge_expired_events(now_ts)
+        for se in stored_events:
+            if se.event_id:
+                app.event_store[se.event_id] = se
+                heapq.heappush(app.event_store_heap, (se.expires_at, se.event_id))
 
     # Build one or more embeds (max 25 fields per embed). For each embed chunk we'll create a montage
     # image out of that chunk's banners and attach it to the message. This preserves the "single embed"
     # feeling per chunk while still supporting many events.
-    from math import ceil
-    from io import BytesIO
-    import urllib.request
-    try:
-        from PIL import Image, ImageDraw, ImageFont
-    except Exception:
-        Image = ImageDraw = ImageFont = None
-
-    # Local copies for nested helpers and static analysis
-    prefix = cfg.ANNOUNCEMENT_TYPES.get("event-reminder", {}).get("title_prefix", "Event Reminder:")
-    color = cfg.ANNOUNCEMENT_TYPES.get("event-reminder", {}).get("color", 0x2F3136)
-    max_field_name = 256
-    max_field_value = 1024
-
-    def _make_field_for_event(ev: Dict[str, Any]):
-        name = _safe_get(ev, "event_name") or "(Unnamed event)"
-        event_id = _safe_get(ev, "event_id") or ""
-        desc = _safe_get(ev, "event_description") or "(No description)"
-        start = _safe_get(ev, "event_start_time") or ""
-        end = _safe_get(ev, "event_end_time") or ""
-        ev_type = _safe_get(ev, "event_type") or ""
-        host = _safe_get(ev, "event_host") or ""
-        featured = _safe_get(ev, "event_feature_fields") or []
-
-        # times
-        times = ""
-        try:
-            sdt = parse_vatsim_logon_time(start) if isinstance(start, str) and start else (start if isinstance(start, datetime) else None)
-            edt = parse_vatsim_logon_time(end) if isinstance(end, str) and end else (end if isinstance(end, datetime) else None)
-            if isinstance(sdt, datetime) and sdt.tzinfo is None:
-                sdt = sdt.replace(tzinfo=timezone.utc)
-            if isinstance(edt, datetime) and edt.tzinfo is None:
-                edt = edt.replace(tzinfo=timezone.utc)
-            if sdt and edt:
-                times = f" — <t:{int(sdt.timestamp())}:F> to <t:{int(edt.timestamp())}:F>"
-            elif sdt:
-                times = f" — <t:{int(sdt.timestamp())}:F>"
-            elif edt:
-                times = f" — <t:{int(edt.timestamp())}:F>"
-            else:
-                if start and end:
-                    times = f" — {start} to {end} (UTC)"
-                elif start:
-                    times = f" — starts {start} (UTC)"
-        except Exception:
-            times = ""
-
-        field_name = f"{name}{times}"
-
-        parts = [desc]
-        meta = []
-        if ev_type:
-            meta.append(f"Type: {ev_type}")
-        if host:
-            meta.append(f"Host: {host}")
-        if meta:
-            parts.append(" • ".join(meta))
-        if isinstance(featured, list) and all(isinstance(x, str) for x in featured) and featured:
-            parts.append("Featured: " + ", ".join(featured))
-        if event_id:
-            parts.append(f"[Event Page](https://vzdc.org/events/{str(event_id).strip()})")
-
-        value = "\n".join(parts)
-        if len(value) > (max_field_value - 4):
-            value = value[: (max_field_value - 7)] + "..."
-
-        return field_name, value
-
     # chunk events and prepare embeds + list of banner URLs per chunk
     chunk_size = 25
-    chunks = [events[i:i+chunk_size] for i in range(0, len(events), chunk_size)]
+    chunks = [stored_events[i:i+chunk_size] for i in range(0, len(stored_events), chunk_size)]
     embeds = []
+    # one timestamp for every chunk of this reminder
+    sent_at = discord.utils.utcnow()
 
-    # Montage settings
-    thumb_w = 320
-    thumb_h = 180
-    cols = 3
-
-    for chunk in chunks:
-        embed = discord.Embed(title=f"{prefix} Weekly Events", color=color)
+    for idx, chunk in enumerate(chunks):
+        embed = discord.Embed(title=_REMINDER_TITLE, color=_REMINDER_COLOR)
         embed.description = f"{len(chunk)} event(s) this message."
 
         banner_urls = []
-        for ev in chunk:
-            fname, fval = _make_field_for_event(ev)
-            if len(fname) > max_field_name:
-                fname = fname[: (max_field_name - 4)] + "..."
+        for se in chunk:
+            fname, fval = _make_field_for_event(se)
             embed.add_field(name=fname, value=fval, inline=False)
-            b = _safe_get(ev, "event_banner_url")
-            if b:
-                banner_urls.append(b)
-
-        # Download banners synchronously and compose a montage image
-        imgs = []
-        for url in banner_urls:
-            try:
-                with urllib.request.urlopen(url, timeout=10) as resp:
-                    data = resp.read()
-                img = Image.open(BytesIO(data)).convert("RGB")
-                imgs.append(img)
-            except Exception:
-                continue
+            if se.banner_url:
+                banner_urls.append(se.banner_url)
 
+        # Compose (or reuse a cached) montage image from this chunk's banners
         montage_bytes = None
-        if imgs:
-            # compute grid size
-            count = len(imgs)
-            cols_use = min(cols, count)
-            rows = ceil(count / cols_use)
-            canvas_w = cols_use * thumb_w
-            canvas_h = rows * thumb_h
-            montage = Image.new("RGB", (canvas_w, canvas_h), (40, 40, 40))
-
-            for idx, im in enumerate(imgs):
-                # resize/crop to thumbnail area while preserving aspect
-                im_thumb = im.copy()
-                im_thumb.thumbnail((thumb_w, thumb_h), Image.LANCZOS)
-                # paste centered in slot
-                row = idx // cols_use
-                col = idx % cols_use
-                x = col * thumb_w + (thumb_w - im_thumb.width) // 2
-                y = row * thumb_h + (thumb_h - im_thumb.height) // 2
-                montage.paste(im_thumb, (x, y))
-
-            bio = BytesIO()
-            montage.save(bio, format="PNG")
-            bio.seek(0)
-            montage_bytes = bio.read()
-
-        # If no banners were downloaded to create a montage, produce a small placeholder
-        if montage_bytes is None and Image is not None:
+        montage_name = f"montage_{idx}.webp"
+        if banner_urls and (pyvips is not None or Image is not None):
             try:
-                # single placeholder image sized for one thumbnail slot
-                ph_w = thumb_w * min(cols, 1)
-                ph_h = thumb_h
-                placeholder = Image.new("RGB", (ph_w, ph_h), (40, 40, 40))
-                draw = ImageDraw.Draw(placeholder)
-                msg = "No banners available"
-                try:
-                    # Use a default font if available
-                    font = ImageFont.load_default() if ImageFont is not None else None
-                    text_w, text_h = draw.textsize(msg, font=font)
-                    draw.text(((ph_w - text_w) / 2, (ph_h - text_h) / 2), msg, fill=(200, 200, 200), font=font)
-                except Exception:
-                    try:
-                        draw.text((10, 10), msg, fill=(200, 200, 200))
-                    except Exception:
-                        pass
-                bio = BytesIO()
-                placeholder.save(bio, format="PNG")
-                bio.seek(0)
-                montage_bytes = bio.read()
+                montage_bytes = _build_montage(tuple(banner_urls), _banner_cache_bucket())
             except Exception:
                 montage_bytes = None
 
-        # If still no montage_bytes, fall back to a tiny embedded PNG so the embed has an image.
+        # If no banners were downloaded to create a montage, use the prebuilt placeholder
         if montage_bytes is None:
-            try:
-                import base64
-                # 1x1 transparent PNG (very small). This guarantees an image attachment even without Pillow.
-                placeholder_png_b64 = (
-                    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR4nGNgYAAAAAMAASsJTYQAAAAA"
-                    "SUVORK5CYII="
-                )
-                montage_bytes = base64.b64decode(placeholder_png_b64)
-            except Exception:
-                montage_bytes = None
+            montage_name = f"montage_{idx}.png"
+            montage_bytes = _PLACEHOLDER_PNG or _FALLBACK_PNG
 
         # Build up to 5 link buttons for this chunk (first 5 events with an id)
-        view = None
+        buttons = []
         try:
-            buttons = []
-            for ev in chunk[:5]:
-                ev_id = _safe_get(ev, "event_id") or ""
-                if not ev_id:
+            for se in chunk[:5]:
+                if not se.event_id:
                     continue
-                label = _safe_get(ev, "event_name") or ev_id
+                label = se.name or se.event_id
                 if len(label) > 80:
                     label = label[:77] + "..."
-                url = f"https://vzdc.org/events/{str(ev_id).strip()}"
-                btn = discord.ui.Button(style=discord.ButtonStyle.link, label=label, url=url)  # type: ignore
+                btn = discord.ui.Button(style=discord.ButtonStyle.link, label=label, url=se.url)  # type: ignore
                 buttons.append(btn)
-            if buttons:
-                view = discord.ui.View()
-                for b in buttons:
-                    view.add_item(b)
         except Exception:
-            view = None
-
-        embeds.append((embed, view, montage_bytes))
-        embed.timestamp = datetime.now(timezone.utc)
-        embed.set_footer(text="vZDC", icon_url=guild_id.icon.url if guild_id.icon else None)
+            buttons = []
 
-    # Send all embeds sequentially to the configured channel using Flask app helper
+        # each chunk references its own attachment so several can share one message
+        embed.set_image(url=f"attachment://{montage_name}")
+        embeds.append((embed, buttons, montage_bytes, montage_name))
+        embed.timestamp = sent_at
+        embed.set_footer(text="vZDC")
+
+    # Pack the chunk embeds into as few messages as Discord allows: up to 10 embeds,
+    # 6000 embed characters and 25 link buttons (5 rows of 5) per message.
+    messages = []
+    for entry in embeds:
+        embed, buttons = entry[0], entry[1]
+        group = messages[-1] if messages else None
+        if (
+            group is None
+            or len(group) >= 10
+            or sum(len(e[0]) for e in group) + len(embed) > 6000
+            or sum(len(e[1]) for e in group) + len(buttons) > 25
+        ):
+            messages.append([entry])
+        else:
+            group.append(entry)
+
+    # Send the messages to the configured channel using Flask app helper
 
     async def _send_all():
         bot = getattr(app, "bot", None)
         if bot is None:
             raise RuntimeError("Discord bot not attached to Flask app")
 
-        # Try get_channel (cache) then fetch_channel
-        channel = bot.get_channel(target_channel_id)
-        if channel is None:
-            try:
-                channel = await bot.fetch_channel(target_channel_id)
-            except Exception:
-                channel = None
-
+        channel = await get_or_fetch_channel(target_channel_id)
         if channel is None:
             raise RuntimeError(f"Could not find channel with id {target_channel_id}")
 
+        # guild_id in the payload is just an id; the icon comes from the resolved channel's guild
+        icon = getattr(getattr(channel, "guild", None), "icon", None)
+        if icon:
+            for entry in embeds:
+                entry[0].set_footer(text="vZDC", icon_url=icon.url)
+
         sent_ids = []
-        for emb in embeds:
-            # each embed entry is a tuple (embed, view, montage_bytes)
-            embed_obj, view_obj, montage_bytes = emb
-            file_obj = None
-            if montage_bytes:
-                try:
-                    file_obj = discord.File(BytesIO(montage_bytes), filename="montage.png")
-                    # set embed image to attachment
-                    embed_obj.set_image(url="attachment://montage.png")
-                except Exception:
-                    file_obj = None
+        for group in messages:
+            # each group entry is a tuple (embed, buttons, montage_bytes, montage_name)
+            group_embeds = [e[0] for e in group]
+            # BytesIO over an immutable bytes object shares its buffer (no copy) until written to
+            files = [discord.File(BytesIO(e[2]), filename=e[3]) for e in group if e[2]]
+            view_obj = None
+            buttons = [b for e in group for b in e[1]]
+            if buttons:
+                view_obj = discord.ui.View()
+                for b in buttons:
+                    view_obj.add_item(b)
 
             try:
-                if file_obj is not None:
-                    msg = await channel.send(embed=embed_obj, view=view_obj, file=file_obj)
+                if view_obj is not None:
+                    msg = await channel.send(embeds=group_embeds, files=files, view=view_obj)
                 else:
-                    msg = await channel.send(embed=embed_obj, view=view_obj)
+                    msg = await channel.send(embeds=group_embeds, files=files)
             except TypeError:
                 # Older discord.py versions or incompatible send signature may not accept view; fallback
-                if file_obj is not None:
-                    msg = await channel.send(embed=embed_obj, file=file_obj)
-                else:
-                    msg = await channel.send(embed=embed_obj)
-            sent_ids.append(getattr(msg, "id", None))
+                msg = await channel.send(embeds=group_embeds, files=files)
+            except (discord.NotFound, discord.Forbidden):
+                # Don't keep serving a channel we can no longer post to
+                evict_channel(target_channel_id)
+                raise
+            # one id per embed, as before embeds were packed into shared messages
+            sent_ids.extend([getattr(msg, "id", None)] * len(group))
         return sent_ids
 
     try:
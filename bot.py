@@ -2,7 +2,7 @@ import os
 import discord
 import asyncio
 import atexit
-import json
+import orjson
 import pathlib
 import logging.config
 import logging.handlers
@@ -21,8 +21,7 @@ logger = logging.getLogger(__name__)
 
 def setup_logging():
     config_file = pathlib.Path("logging_conf.json")
-    with open(config_file) as f_in:
-        config = json.load(f_in)
+    config = orjson.loads(config_file.read_bytes())
 
     # Ensure any file handler target directories exist before configuring logging.
     handlers = config.get("handlers", {})
@@ -40,12 +39,14 @@ def setup_logging():
 
     logging.config.dictConfig(config)
 
-    # Try to find a QueueHandler instance and start its attached listener if present.
-    queue_handler = None
-    for h in logging.root.handlers:
-        if isinstance(h, logging.handlers.QueueHandler):
-            queue_handler = h
-            break
+    # Find the QueueHandler (if configured) and start its attached listener. Python 3.12+
+    # can look it up by name; older interpreters fall back to a single scan.
+    get_handler_by_name = getattr(logging, "getHandlerByName", None)
+    queue_handler = get_handler_by_name("queue_handler") if get_handler_by_name else None
+    if not isinstance(queue_handler, logging.handlers.QueueHandler):
+        queue_handler = next(
+            (h for h in logging.root.handlers if isinstance(h, logging.handlers.QueueHandler)), None
+        )
 
     if queue_handler is not None:
         listener = getattr(queue_handler, "listener", None)
@@ -75,15 +76,22 @@ async def load_extensions():
         logger.warning("Extensions path %s exists but is not a directory — skipping extension loading.", extensions_path)
         return
 
-    for filename in os.listdir(str(extensions_path)):
-        if filename.endswith(".py"):
-            extension_name = filename[:-3]
-            try:
-                await bot.load_extension(f"extensions.{extension_name}")
-                logger.info(f"Loaded extension: {extension_name}")
-            except Exception as e:
-                logger.error(f"An unexpected error occurred while loading extension "
-                             f"'{extension_name}': {e}", exc_info=True)
+    # scandir yields names without an extra stat per entry; sort for a stable load order.
+    extension_names = sorted(
+        entry.name[:-3] for entry in os.scandir(extensions_path)
+        if entry.name.endswith(".py") and entry.is_file()
+    )
+    # Load concurrently so any awaiting done in the extensions' setup() overlaps.
+    results = await asyncio.gather(
+        *(bot.load_extension(f"extensions.{name}") for name in extension_names),
+        return_exceptions=True,
+    )
+    for extension_name, result in zip(extension_names, results):
+        if isinstance(result, BaseException):
+            logger.error(f"An unexpected error occurred while loading extension "
+                         f"'{extension_name}': {result}", exc_info=result)
+        else:
+            logger.info(f"Loaded extension: {extension_name}")
 
 
 async def main():
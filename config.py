@@ -1,32 +1,81 @@
 import os
-import json
+import orjson
 import pathlib
-import discord
-import shutil
+import sys
 import time
+import types
 import logging
 import ast
+import collections
+import functools
 from dotenv import load_dotenv
 
-load_dotenv()
+
+
+def _load_env() -> dict:
+    """Apply .env and snapshot the environment; called once, at import."""
+    load_dotenv()
+    return os.environ.copy()
+
+
+# All settings below read from this snapshot.
+_E = _load_env()
+
+
+def _int(key: str, default=None):
+    val = _E.get(key)
+    if val is None:
+        return default
+    try:
+        return int(val)
+    except ValueError:
+        # Don't take the whole bot down at import over one bad setting
+        logging.getLogger(__name__).error("Invalid integer for %s=%r; using default %r", key, val, default)
+        return default
+
+
+def _float(key: str, default=None):
+    val = _E.get(key)
+    if val is None:
+        return default
+    try:
+        return float(val)
+    except ValueError:
+        logging.getLogger(__name__).error("Invalid number for %s=%r; using default %r", key, val, default)
+        return default
+
 
 # --------- Environment-only secrets (stay in .env) ---------
-DISCORD_TOKEN = os.getenv("DISCORD_TOKEN")
+# Discord token, API key and VATUSA credentials have no defaults; read them in one pass.
+DISCORD_TOKEN, API_SECRET_KEY, VATUSA_API_KEY, VATUSA_API_URL = map(
+    _E.get, ("DISCORD_TOKEN", "API_SECRET_KEY", "VATUSA_API_KEY", "VATUSA_API_URL")
+)
 
 # API
-API_SECRET_KEY = os.getenv("API_SECRET_KEY")
-API_PORT = int(os.getenv("API_PORT", 6000))
-
-# VATUSA
-VATUSA_API_KEY = os.getenv("VATUSA_API_KEY")
-VATUSA_API_URL = os.getenv("VATUSA_API_URL")
+API_PORT = _int("API_PORT", 6000)
+# Seconds an API request thread waits for a coroutine it scheduled on the bot loop
+DISCORD_OP_TIMEOUT = _float("DISCORD_OP_TIMEOUT", 60.0)
+# waitress worker threads; each one blocks for the length of a Discord op, so bursts need more than the default 4
+API_THREADS = _int("API_THREADS", 16)
+# Concurrent connections waitress accepts before refusing new ones
+API_CONNECTION_LIMIT = _int("API_CONNECTION_LIMIT", 256)
+# Seconds weekly-reminder events stay in the API's in-memory event store (default 24 hours)
+EVENT_STORE_TTL = _int("EVENT_STORE_TTL", 86400)
 
 # Where per-guild configs are stored
 MAIN_DIRECTORY = os.getcwd()
-GUILD_CONFIG_FILE = os.getenv("GUILD_CONFIG_FILE", os.path.join(MAIN_DIRECTORY, "data", "guild_configs.json"))
+GUILD_CONFIG_FILE = _E.get("GUILD_CONFIG_FILE", os.path.join(MAIN_DIRECTORY, "data", "guild_configs.json"))
 
-# Internal cache for loaded guild configs
+# Internal cache for loaded guild configs, plus the raw mapping they were built from
+# (what save_guild_config writes back)
 _guild_configs = {}
+_guild_configs_raw = {}
+# st_mtime_ns of the guild config file at the last successful load
+_last_mtime_ns = None
+# (guild_id, announcement type) -> channel id for every loaded guild; rebuilt on reload
+_ANN_TARGET_CACHE = {}
+# Bumped whenever the loaded configs may have changed; part of the channel/role resolver cache keys
+_config_version = 0
 
 # Default shape for a guild config — keeps channel & role ids here
 _DEFAULT_GUILD_CONFIG = {
@@ -60,6 +109,66 @@ _DEFAULT_GUILD_CONFIG = {
 }
 
 
+# Embed colours used by the announcement types (the matching discord.Color presets)
+_BLUE = 0x3498DB  # Color.blue()
+_GOLD = 0xF1C40F  # Color.gold()
+_GREEN = 0x2ECC71  # Color.green()
+_ORANGE = 0xE67E22  # Color.orange()
+_DARK_TEAL = 0x11806A  # Color.dark_teal()
+_LIGHT_GREY = 0x979C9F  # Color.light_grey()
+_DARK_GOLD = 0xC27C0E  # Color.dark_gold()
+_DARK_GREEN = 0x1F8B4C  # Color.dark_green()
+_DARK_ORANGE = 0xA84300  # Color.dark_orange()
+_DARK_GREY = 0x607D8B  # Color.dark_grey()
+_MAGENTA = 0xE91E63  # Color.magenta()
+_DARK_BLUE = 0x206694  # Color.dark_blue()
+
+
+# Module-level defaults for announcements (fallback values); the real channel comes from
+# the per-guild config via channel_key, and guilds can override types via GuildConfig
+class AnnouncementType(collections.namedtuple("AnnouncementType", "channel_key color title_prefix")):
+    __slots__ = ()
+
+    def __new__(cls, channel_key, color, title_prefix):
+        # Intern the strings: the many types sharing a channel_key/prefix then share one
+        # object, and channel_key lookups in guild channel dicts hit the identity fast path.
+        return super().__new__(cls, sys.intern(channel_key), color, sys.intern(title_prefix))
+
+
+ANNOUNCEMENT_TYPES = types.MappingProxyType({
+    # Announcements
+    "general": AnnouncementType("general_announcement_channel_id", _BLUE, "📢 General Announcement:"),
+    "event": AnnouncementType("event_announcement_channel_id", _GOLD, "🗓️ Event Announcement:"),
+    "event-posting": AnnouncementType("event_announcement_channel_id", _GOLD, "🗓️ Event Announcement:"),
+    "training": AnnouncementType("training_announcement_channel_id", _GREEN, "🎓 Training Announcement:"),
+    "websystem": AnnouncementType("websystem_announcement_channel_id", _ORANGE, "🌐 Web System Announcement:"),
+    "facility": AnnouncementType("facility_announcement_channel_id", _DARK_TEAL, "🏢 Facility Announcement:"),
+    # Updates and other legacy keys map to same channel keys
+    "general-update": AnnouncementType("general_announcement_channel_id", _LIGHT_GREY, "⚙️ General Update:"),
+    "event-update": AnnouncementType("event_announcement_channel_id", _DARK_GOLD, "🗓️ Event Update:"),
+    "training-update": AnnouncementType("training_announcement_channel_id", _DARK_GREEN, "📚 Training Update:"),
+    "websystem-update": AnnouncementType("websystem_announcement_channel_id", _DARK_ORANGE, "🛠️ Web System Update:"),
+    "facility-update": AnnouncementType("facility_announcement_channel_id", _DARK_GREY, "📰 Facility Update:"),
+    "event-reminder": AnnouncementType("event_announcement_channel_id", _MAGENTA, "🔔 Event Reminder:"),
+    "event-position-posting": AnnouncementType("event_announcement_channel_id", _DARK_BLUE, "Event Posting Posting:"),
+    "event-announcement": AnnouncementType("event_announcement_channel_id", _DARK_BLUE, "Event Announcement:"),
+})
+
+
+_EMPTY_ANN = types.MappingProxyType({})
+
+
+def _to_id(val):
+    """Cast a configured channel/role id to int; None for unset or malformed values."""
+    if val is None:
+        return None
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        logging.getLogger(__name__).warning("Ignoring malformed id in guild config: %r", val)
+        return None
+
+
 class GuildConfig:
     """Simple wrapper around a per-guild config dictionary.
 
@@ -67,38 +176,93 @@ class GuildConfig:
     type configuration falling back to module-level defaults.
     """
 
+    __slots__ = ("guild_id", "_data", "_channels", "_roles", "_ann", "_ann_channels")
+
     def __init__(self, guild_id: int, data: dict):
         self.guild_id = int(guild_id)
-        # Merge with defaults to ensure keys exist
-        base = json.loads(json.dumps(_DEFAULT_GUILD_CONFIG))
-        base.update(data or {})
-        # deep merge for nested dicts
-        for k in ("channels", "roles"):
-            if k in data:
-                base[k].update(data.get(k, {}))
-        base["announcement_types"].update((data.get("announcement_types") or {}))
+        data = data or {}
+        # Merge with defaults to ensure keys exist. Top-level extras (e.g. "categories")
+        # are kept; the nested id maps are merged into fresh dicts so the guild's own
+        # entries override the defaults without losing default keys or aliasing `data`.
+        base = dict(data)
+        base["channels"] = {**_DEFAULT_GUILD_CONFIG["channels"], **(data.get("channels") or {})}
+        base["roles"] = {**_DEFAULT_GUILD_CONFIG["roles"], **(data.get("roles") or {})}
+        base["announcement_types"] = {**(data.get("announcement_types") or {})}
         self._data = base
+        # Ids normalised to int once here so accessors are a single lookup; as_dict()
+        # still returns the data as loaded.
+        self._channels = {k: _to_id(v) for k, v in base["channels"].items()}
+        self._roles = {k: _to_id(v) for k, v in base["roles"].items()}
+        # Most guilds have no announcement overrides; they all share one empty mapping
+        self._ann = base["announcement_types"] or _EMPTY_ANN
+        # Announcement type -> channel id for this guild: a per-guild override's
+        # channel_id wins, otherwise the type's channel_key in this guild's channels.
+        self._ann_channels = {}
+        has_overrides = self._ann is not _EMPTY_ANN
+        for mt, entry in ANNOUNCEMENT_TYPES.items():
+            per = self._ann.get(mt) if has_overrides else None
+            cid = _to_id(per.get("channel_id")) if isinstance(per, dict) and per.get("channel_id") else None
+            if cid is None:
+                cid = self._channels.get(entry.channel_key)
+            if cid is not None:
+                self._ann_channels[mt] = cid
 
     def get_channel(self, key: str):
-        val = self._data.get("channels", {}).get(key)
-        return int(val) if val is not None else None
+        return self._channels.get(key)
 
     def get_role(self, key: str):
-        val = self._data.get("roles", {}).get(key)
-        return int(val) if val is not None else None
+        return self._roles.get(key)
 
     def get_announcement_type(self, name: str):
-        return self._data.get("announcement_types", {}).get(name)
+        return self._ann.get(name)
 
     def as_dict(self):
         return self._data
 
 
+# Handed out by get_guild_config() for every guild without a saved config
+_DEFAULT_GUILD_CFG = GuildConfig(0, {})
+
+
+def _read_if_changed(path: pathlib.Path):
+    """Open `path` once and return (st_mtime_ns, contents).
+
+    contents is None when the mtime matches the last successful load. Raises
+    FileNotFoundError if the file is missing.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        if st.st_mtime_ns == _last_mtime_ns:
+            return st.st_mtime_ns, None
+        buf = bytearray()
+        while True:
+            chunk = os.read(fd, max(st.st_size - len(buf), 0) + 65536)
+            if not chunk:
+                break
+            buf += chunk
+        return st.st_mtime_ns, bytes(buf)
+    finally:
+        os.close(fd)
+
+
 def _load_guild_configs_from_disk():
-    global _guild_configs
+    global _guild_configs, _guild_configs_raw, _last_mtime_ns
     path = pathlib.Path(GUILD_CONFIG_FILE)
+    try:
+        mtime_ns, raw_bytes = _read_if_changed(path)
+    except FileNotFoundError:
+        mtime_ns = raw_bytes = None
+    except OSError:
+        logging.getLogger(__name__).exception("Failed to read guild configs from %s", path)
+        _guild_configs, _guild_configs_raw = {}, {}
+        return
+    else:
+        if raw_bytes is None:
+            # unchanged since the last successful load; keep the parsed configs
+            return
     logging.getLogger(__name__).info("Loading guild configs from %s", path)
-    if not path.exists():
+    if mtime_ns is None:
         # create a default empty file if missing
         path.parent.mkdir(parents=True, exist_ok=True)
         # Default data to seed the guild config file (valid JSON)
@@ -165,7 +329,7 @@ def _load_guild_configs_from_disk():
 
         # Write valid JSON to disk
         try:
-            path.write_text(json.dumps(text, indent=2))
+            path.write_bytes(orjson.dumps(text, option=orjson.OPT_INDENT_2))
         except Exception:
             # If writing fails, propagate so callers can handle it
             raise
@@ -179,27 +343,26 @@ def _load_guild_configs_from_disk():
             except Exception:
                 # Skip malformed entries
                 continue
-        _guild_configs = loaded
+        _guild_configs, _guild_configs_raw = loaded, text
         logging.getLogger(__name__).info("Created default guild config file and loaded %d guild(s)", len(_guild_configs))
         return
 
     try:
-        raw_text = path.read_text()
         try:
-            raw = json.loads(raw_text)
+            raw = orjson.loads(raw_bytes)
         except Exception as e_json:
             # Attempt to recover from a Python dict repr (common when other tooling wrote the file)
             logging.getLogger(__name__).warning("Failed to parse %s as JSON: %s; attempting Python literal_eval fallback", path, e_json)
             try:
-                raw = ast.literal_eval(raw_text)
+                raw = ast.literal_eval(raw_bytes.decode("utf-8"))
                 # Normalise: write back valid JSON so future loads succeed
                 try:
-                    path.write_text(json.dumps(raw, indent=2))
+                    path.write_bytes(orjson.dumps(raw, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
                 except Exception:
                     logging.getLogger(__name__).exception("Failed to rewrite %s as JSON after literal_eval recovery", path)
             except Exception as e_eval:
                 logging.getLogger(__name__).exception("Failed to parse %s as JSON or Python literal: %s", path, e_eval)
-                _guild_configs = {}
+                _guild_configs, _guild_configs_raw = {}, {}
                 return
 
         # Expecting top-level mapping: guild_id -> config
@@ -211,146 +374,167 @@ def _load_guild_configs_from_disk():
             except Exception:
                 # skip malformed keys
                 continue
-        _guild_configs = loaded
+        _guild_configs, _guild_configs_raw = loaded, raw
+        _last_mtime_ns = mtime_ns
         logging.getLogger(__name__).info("Loaded %d guild config(s) from %s", len(_guild_configs), path)
     except Exception:
-        _guild_configs = {}
+        _guild_configs, _guild_configs_raw = {}, {}
 
 
 # Load at import time (and allow reload later)
+def _rebuild_ann_target_cache():
+    """Flatten every loaded guild's announcement channels into (guild_id, type) -> channel id."""
+    global _ANN_TARGET_CACHE
+    _ANN_TARGET_CACHE = {
+        (gid, mt): channel_id
+        for gid, guild_cfg in _guild_configs.items()
+        for mt, channel_id in guild_cfg._ann_channels.items()
+    }
+
+
 _load_guild_configs_from_disk()
+_rebuild_ann_target_cache()
 
 
 def reload_guild_configs():
+    global _config_version
     _load_guild_configs_from_disk()
+    _rebuild_ann_target_cache()
+    _config_version += 1
 
 
 def get_guild_config(guild_id: int) -> GuildConfig:
     """Return a GuildConfig for the specified guild id.
 
-    If no config is found for the guild, returns a GuildConfig with defaults
-    (all channel/role getters return None).
+    If no config is found for the guild, returns the shared defaults-only
+    GuildConfig (all channel/role getters return None; its guild_id is 0).
+    Nothing is stored for unknown ids, so arbitrary ids passed in through the
+    API don't accumulate.
     """
-    if guild_id is None:
-        return GuildConfig(0, {})
-    gid = int(guild_id)
-    cfg = _guild_configs.get(gid)
-    if cfg is None:
-        # return empty config object for unknown guilds
-        return GuildConfig(gid, {})
-    return cfg
-
-
-# Module-level defaults for announcements (fallback values)
-# Keep the old ANNOUNCEMENT_TYPES shape but allow per-guild overrides via GuildConfig
-ANNOUNCEMENT_TYPES = {
-    # Announcements
-    "general": {
-        # channel_id intentionally None; real channel comes from per-guild config
-        "channel_key": "general_announcement_channel_id",
-        "color": discord.Color.blue().value,
-        "title_prefix": "📢 General Announcement:"
-    },
-    "event": {
-        "channel_key": "event_announcement_channel_id",
-        "color": discord.Color.gold().value,
-        "title_prefix": "🗓️ Event Announcement:"
-    },
-    "event-posting": {
-        "channel_key": "event_announcement_channel_id",
-        "color": discord.Color.gold().value,
-        "title_prefix": "🗓️ Event Announcement:"
-    },
-    "training": {
-        "channel_key": "training_announcement_channel_id",
-        "color": discord.Color.green().value,
-        "title_prefix": "🎓 Training Announcement:"
-    },
-    "websystem": {
-        "channel_key": "websystem_announcement_channel_id",
-        "color": discord.Color.orange().value,
-        "title_prefix": "🌐 Web System Announcement:"
-    },
-    "facility": {
-        "channel_key": "facility_announcement_channel_id",
-        "color": discord.Color.dark_teal().value,
-        "title_prefix": "🏢 Facility Announcement:"
-    },
-    # Updates and other legacy keys map to same channel keys
-    "general-update": {"channel_key": "general_announcement_channel_id", "color": discord.Color.light_grey().value, "title_prefix": "⚙️ General Update:"},
-    "event-update": {"channel_key": "event_announcement_channel_id", "color": discord.Color.dark_gold().value, "title_prefix": "🗓️ Event Update:"},
-    "training-update": {"channel_key": "training_announcement_channel_id", "color": discord.Color.dark_green().value, "title_prefix": "📚 Training Update:"},
-    "websystem-update": {"channel_key": "websystem_announcement_channel_id", "color": discord.Color.dark_orange().value, "title_prefix": "🛠️ Web System Update:"},
-    "facility-update": {"channel_key": "facility_announcement_channel_id", "color": discord.Color.dark_grey().value, "title_prefix": "📰 Facility Update:"},
-    "event-reminder": {"channel_key": "event_announcement_channel_id", "color": discord.Color.magenta().value, "title_prefix": "🔔 Event Reminder:"},
-    "event-position-posting": {"channel_key": "event_announcement_channel_id", "color": discord.Color.dark_blue().value, "title_prefix": "Event Posting Posting:"},
-    "event-announcement": {"channel_key": "event_announcement_channel_id", "color": discord.Color.dark_blue().value, "title_prefix": "Event Announcement:"},
-}
+    gid = 0 if guild_id is None else int(guild_id)
+    return _guild_configs.get(gid, _DEFAULT_GUILD_CFG)
 
 
 def resolve_announcement_target_channel(guild_id: int, message_type: str):
     """Return a channel id (int) for the given guild and message_type.
 
     Looks for per-guild override under guild_config['announcement_types'][message_type]['channel_id']
-    or falls back to ANNOUNCEMENT_TYPES mapping which references a channel_key.
+    or falls back to ANNOUNCEMENT_TYPES mapping which references a channel_key; both are
+    resolved when configs are loaded. `message_type` must already be a canonical
+    (lower-case) ANNOUNCEMENT_TYPES key; the API normalises it where it accepts user input.
     """
-    mt = message_type.lower()
-    if mt not in ANNOUNCEMENT_TYPES:
-        return None
-    guild_cfg = get_guild_config(guild_id)
-    # Check per-guild announcement overrides first
-    per = guild_cfg.get_announcement_type(mt)
-    if per and per.get("channel_id"):
-        return int(per.get("channel_id"))
-    # Fallback to mapped channel key
-    key = ANNOUNCEMENT_TYPES[mt].get("channel_key")
-    return guild_cfg.get_channel(key)
+    gid = 0 if guild_id is None else int(guild_id)
+    return _ANN_TARGET_CACHE.get((gid, message_type))
 
 
 # Backwards compatibility helpers: code that used old module-level constants can call these
 # e.g. config.get_channel_for_guild(guild_id, 'break_board_channel_id')
 
-def get_channel_for_guild(guild_id: int, key: str):
+@functools.lru_cache(maxsize=4096)
+def _resolve_channel(version: int, guild_id: int, key: str):
     return get_guild_config(guild_id).get_channel(key)
 
 
-def get_role_for_guild(guild_id: int, key: str):
+@functools.lru_cache(maxsize=4096)
+def _resolve_role(version: int, guild_id: int, key: str):
     return get_guild_config(guild_id).get_role(key)
 
 
+# Both helpers memoise on the config version, so entries cached before a reload or save are never hit again
+def get_channel_for_guild(guild_id: int, key: str):
+    return _resolve_channel(_config_version, 0 if guild_id is None else int(guild_id), key)
+
+
+def get_role_for_guild(guild_id: int, key: str):
+    return _resolve_role(_config_version, 0 if guild_id is None else int(guild_id), key)
+
+
+# Number of guild config backups save_guild_config keeps around
+GUILD_CONFIG_BACKUPS = 5
+
+
+def _prune_guild_config_backups(path: pathlib.Path):
+    """Delete all but the newest GUILD_CONFIG_BACKUPS `<name>.bak.<epoch>` files."""
+    prefix = f"{path.name}.bak."
+    backups = []
+    for entry in os.scandir(path.parent):
+        suffix = entry.name[len(prefix):]
+        if entry.name.startswith(prefix) and suffix.isdigit():
+            backups.append((int(suffix), entry.path))
+    backups.sort()
+    for _, stale in backups[:-GUILD_CONFIG_BACKUPS]:
+        try:
+            os.remove(stale)
+        except OSError:
+            pass
+
+
 # If you need to programmatically update a guild config at runtime, you can call save_guild_config
 def save_guild_config(guild_id: int, data: dict):
+    global _last_mtime_ns, _config_version, _guild_configs_raw
     path = pathlib.Path(GUILD_CONFIG_FILE)
-    try:
-        raw = json.loads(path.read_text()) if path.exists() else {}
-    except Exception:
-        raw = {}
-    raw[str(int(guild_id))] = data
+    # Pick up any edits made to the file since the last load (a single fstat when unchanged),
+    # then merge this guild into the in-memory mapping instead of re-reading the file.
+    reload_guild_configs()
+    gid = int(guild_id)
+    # Build a new mapping; the cached one is only swapped out once the write has succeeded
+    raw = {**_guild_configs_raw, str(gid): data}
 
-    # Create a timestamped backup of the existing file to guard against accidental data loss
+    # Keep a timestamped backup of the existing file to guard against accidental data loss.
+    # A hard link costs no data copy: the atomic replace below swaps in a new inode, so
+    # the link keeps the previous contents.
     try:
-        if path.exists():
-            bak_name = f"{path.name}.bak.{int(time.time())}"
-            bak_path = path.parent.joinpath(bak_name)
-            shutil.copy2(path, bak_path)
+        bak_path = path.parent.joinpath(f"{path.name}.bak.{int(time.time())}")
+        try:
+            os.link(path, bak_path)
+        except FileExistsError:
+            # already backed up this second
+            pass
+        _prune_guild_config_backups(path)
+    except FileNotFoundError:
+        # nothing on disk yet, so nothing to back up
+        pass
     except Exception:
         # Don't fail the save if backup can't be created; continue to attempt save
         pass
 
-    # Atomic write: write to a temp file then replace the original
+    payload = orjson.dumps(raw, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    # Atomic write: write and fsync a temp file, then replace the original. There is no
+    # direct-write fallback; a failed save leaves the previous file intact and raises.
+    tmp_path = path.parent.joinpath(path.name + ".tmp")
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
     try:
-        tmp_path = path.parent.joinpath(path.name + ".tmp")
-        tmp_path.write_text(json.dumps(raw, indent=2))
-        # Use replace/rename which is atomic on most OSes
-        tmp_path.replace(path)
+        os.replace(tmp_path, path)
     except Exception:
-        # If atomic replace fails, fall back to direct write
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # Persist the rename itself (POSIX)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
         try:
-            path.write_text(json.dumps(raw, indent=2))
-        except Exception:
-            # At this point the write failed; leave things as-is and re-raise
-            raise
-    reload_guild_configs()
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    except OSError:
+        pass
+
+    # Update the in-memory configs directly rather than re-reading the file just written
+    _guild_configs_raw = raw
+    _guild_configs[gid] = GuildConfig(gid, data)
+    try:
+        _last_mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        _last_mtime_ns = None
+    _rebuild_ann_target_cache()
+    _config_version += 1
 
 
 # End of file
@@ -1,23 +1,49 @@
 from discord.ext import commands
 from flask import Flask, jsonify, request
+from flask.json.provider import JSONProvider
 from waitress import serve
 import asyncio
+import concurrent.futures
+import hmac
 import threading
 import logging
-import importlib
-from config import API_SECRET_KEY, API_PORT
+import orjson
+from config import (
+    API_SECRET_KEY, API_PORT, API_THREADS, API_CONNECTION_LIMIT, DISCORD_OP_TIMEOUT,
+    ANNOUNCEMENT_TYPES, resolve_announcement_target_channel,
+)
 from bot import logger  # use the project logger instead of prints
 
 # Reduce werkzeug logging noise but keep the project's logger for messages
 werkzeug_logger = logging.getLogger('werkzeug')
 werkzeug_logger.setLevel(logging.ERROR)
 
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, so jsonify and request.get_json() skip the stdlib json module."""
+
+    def dumps(self, obj, **kwargs):
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("sort_keys"):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        # No str() fallback: unsupported types raise TypeError instead of serialising as their repr
+        return orjson.dumps(obj, default=kwargs.get("default"), option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Attach attributes used elsewhere so static analyzers won't complain.
 # These get set properly when the cog is initialized.
 app.bot = None  # type: ignore[attr-defined]
 app.bot_loop = None  # type: ignore[attr-defined]
+app.channel_cache = {}  # type: ignore[attr-defined]  # channel id -> channel, primed on ready
+
 
 def run_discord_op(coro):
     if not hasattr(app, 'bot_loop') or app.bot_loop is None:
@@ -25,11 +51,62 @@ def run_discord_op(coro):
         raise RuntimeError("Bot event loop not set up in Flask app. Is the bot ready?")
 
     future = asyncio.run_coroutine_threadsafe(coro, app.bot_loop)
-    return future.result()
+    try:
+        return future.result(timeout=DISCORD_OP_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        # Don't leave the coroutine running on the bot loop once the API request has given up
+        future.cancel()
+        logger.error("Discord operation timed out after %ss", DISCORD_OP_TIMEOUT)
+        raise
 
 
 app.run_discord_op = run_discord_op
+
+
+async def get_or_fetch_channel(channel_id):
+    """Resolve a channel via the bot cache, then app.channel_cache, then the API.
+
+    The gateway-maintained bot cache is checked first so a stale app.channel_cache entry
+    can't shadow it. Must run on the bot loop. Returns None if the channel can't be found.
+    """
+    bot = app.bot
+    channel = bot.get_channel(channel_id)
+    if channel is not None:
+        app.channel_cache[channel_id] = channel
+        return channel
+    channel = app.channel_cache.get(channel_id)
+    if channel is not None:
+        return channel
+    try:
+        channel = await bot.fetch_channel(channel_id)
+    except Exception:
+        evict_channel(channel_id)
+        return None
+    app.channel_cache[channel_id] = channel
+    return channel
+
+
+def evict_channel(channel_id):
+    """Drop a channel from app.channel_cache, e.g. after a send fails with NotFound/Forbidden."""
+    app.channel_cache.pop(int(channel_id), None)
+
+
+def get_json_body():
+    """Parse a JSON request body with orjson, like request.get_json(silent=True).
+
+    Returns None when the request isn't application/json or the body is empty or invalid.
+    """
+    if not request.is_json:
+        return None
+    try:
+        return orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return None
+
+
 app.secret_key = API_SECRET_KEY
+# Encoded once; api_key_required compares raw header bytes against it
+_API_KEY_B = (API_SECRET_KEY or "").encode()
 
 
 class APIServer(commands.Cog):  # Renamed to APIServer
@@ -41,29 +118,26 @@ class APIServer(commands.Cog):  # Renamed to APIServer
         app.bot = self.bot
         app.bot_loop = None
 
-        # Register the actual available blueprints in api_routes
-        self.blueprint_modules = [
-            "api_routes.announcements",
-            "api_routes.event_position_posting",
-            "api_routes.weekly_event_reminder",
-            "api_routes.user_role_sync",
-            "api_routes.create_training_channel",
-        ]
         self._register_blueprints()
 
     def _register_blueprints(self):
-        for module_name in self.blueprint_modules:
-            try:
-                module = importlib.import_module(module_name)
-                if hasattr(module, 'bp'):
-                    app.register_blueprint(module.bp)
-                    logger.info(f"Registered Flask Blueprint: {module_name}")
-                else:
-                    logger.warning(f"Module {module_name} does not have a 'bp' attribute.")
-            except ImportError as e:
-                logger.error(f"Error importing blueprint module {module_name}: {e}")
-            except Exception as e:
-                logger.exception(f"Error registering blueprint {module_name}: {e}")
+        # Imported here rather than at module top: every route module imports
+        # app/api_key_required from this module, so a top-level import would be circular.
+        from api_routes.announcements import bp as announcements_bp
+        from api_routes.event_position_posting import bp as event_position_posting_bp
+        from api_routes.weekly_event_reminder import bp as weekly_event_reminder_bp
+        from api_routes.user_role_sync import bp as user_role_sync_bp
+        from api_routes.create_training_channel import bp as create_training_channel_bp
+
+        for bp in (
+            announcements_bp,
+            event_position_posting_bp,
+            weekly_event_reminder_bp,
+            user_role_sync_bp,
+            create_training_channel_bp,
+        ):
+            app.register_blueprint(bp)
+            logger.info("Registered Flask Blueprint: %s", bp.name)
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -81,12 +155,36 @@ class APIServer(commands.Cog):  # Renamed to APIServer
             self.api_thread.start()
             self.api_running = True
             logger.info("API Server listener thread started.")
+            await self._prime_channel_cache()
         else:
             logger.debug("API Server already running; on_ready called again.")
 
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel):
+        evict_channel(channel.id)
+
+    async def _prime_channel_cache(self):
+        """Resolve every guild's announcement channels once so API requests skip the lookups."""
+        for guild in self.bot.guilds:
+            for message_type in ANNOUNCEMENT_TYPES:
+                try:
+                    channel_id = resolve_announcement_target_channel(guild.id, message_type)
+                except Exception:
+                    channel_id = None
+                if channel_id and channel_id not in app.channel_cache:
+                    await get_or_fetch_channel(channel_id)
+        logger.info("Primed API channel cache with %d channel(s)", len(app.channel_cache))
+
     def _run_flask_app(self):
         try:
-            serve(app, host="0.0.0.0", port=API_PORT)
+            serve(
+                app,
+                host="0.0.0.0",
+                port=API_PORT,
+                threads=API_THREADS,
+                connection_limit=API_CONNECTION_LIMIT,
+                asyncore_use_poll=True,
+            )
         except Exception as e:
             logger.exception(f"API server failed to start: {e}")
 
@@ -99,8 +197,8 @@ class APIServer(commands.Cog):  # Renamed to APIServer
 
 def api_key_required(f):
     def decorated_function(*args, **kwargs):
-        auth_header = request.headers.get("X-API-Key")
-        if not auth_header or auth_header != app.secret_key:
+        auth_header = request.headers.get("X-API-Key", "").encode()
+        if not auth_header or not _API_KEY_B or not hmac.compare_digest(auth_header, _API_KEY_B):
             logger.warning("Unauthorized API request from %s", request.remote_addr)
             return jsonify({"error": "Unauthorized", "message": "Invalid or missing API key"}), 401
         return f(*args, **kwargs)
@@ -108,6 +206,7 @@ def api_key_required(f):
     decorated_function.__name__ = f.__name__
     return decorated_function
 
+
 async def setup(bot):
     await bot.add_cog(APIServer(bot))
     # The bot's load_extensions function will load other cogs in the extensions folder.
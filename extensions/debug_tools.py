@@ -139,10 +139,9 @@ class DebugTools(commands.Cog):
             await ctx.send("This command must be run in a guild.")
             return
 
-        # Load current config dict and update the break_board_channel_id
-        current = cfg.get_guild_config(guild.id).as_dict()
-        if "channels" not in current:
-            current["channels"] = {}
+        # Copy the current config dict (it may be the shared default) and update the break_board_channel_id
+        current = dict(cfg.get_guild_config(guild.id).as_dict())
+        current["channels"] = dict(current.get("channels") or {})
         current["channels"]["break_board_channel_id"] = int(channel.id)
 
         try:
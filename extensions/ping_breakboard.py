@@ -1,11 +1,100 @@
+import asyncio
 import discord
+import functools
 from bot import logger
 from discord.ext import commands
-import json
+import logging
+import orjson
 import os
-import re
 import config as cfg
 
+# Units accepted by _parse_wait_time; only minutes may follow an hour/minute amount ("1hr 30min")
+_WAIT_UNITS = frozenset({"m", "min", "minute", "minutes", "h", "hr", "hour", "hours"})
+_WAIT_MINUTE_UNITS = frozenset({"m", "min", "minute", "minutes"})
+
+
+def _parse_wait_time(s: str) -> str | None:
+    """Validate a wait time such as "15 minutes", "30m", "1h" or "1hr 30min" in a single pass.
+
+    Returns `s` when it is <number><unit> optionally followed by <number><minute unit>,
+    otherwise None. Unlike a regex with nested optional groups this never backtracks.
+    """
+    n = len(s)
+    i = 0
+    units = _WAIT_UNITS
+    for _ in range(2):
+        start = i
+        while i < n and s[i].isdecimal():
+            i += 1
+        if i == start:
+            return None
+        while i < n and s[i].isspace():
+            i += 1
+        start = i
+        while i < n and s[i].isalpha():
+            i += 1
+        if s[start:i].lower() not in units:
+            return None
+        if i == n:
+            return s
+        while i < n and s[i].isspace():
+            i += 1
+        units = _WAIT_MINUTE_UNITS
+    return None
+
+def _log_text_channels(guild: discord.Guild):
+    """Debug aid when a configured channel can't be resolved; skipped entirely unless DEBUG is on."""
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    try:
+        available = ", ".join([f"{c.name}({c.id})" for c in guild.text_channels])
+        logger.debug("Guild %s text channels: %s", guild.id, available)
+    except Exception:
+        logger.debug("Could not list guild text channels for debugging.")
+
+
+# The board embeds are static, so each is built once and reused for every guild's message
+_BREAKBOARD_EMBED = discord.Embed(
+    title="Controller Break Notification System",
+    description=(
+        "Use the buttons below to request a break for specific positions.\n"
+        "- The message will include a 'Claim' and 'Done / Delete' button."
+        "- Press the 'Complete' button to delete the message when the shift change is complete."
+    ),
+    color=discord.Color.blue()
+)
+
+_ROLE_SELECTOR_EMBED = discord.Embed(
+    title="🔔 Controller Notification Preferences 🔔",
+    description=(
+        "Click the buttons below to **opt in or out** of receiving notifications "
+        "when controllers request a break for specific positions.\n\n"
+        "• If you have the role, clicking the button will **remove** it.\n"
+        "• If you don't have the role, clicking the button will **add** it."
+    ),
+    color=discord.Color.gold()
+)
+_ROLE_SELECTOR_EMBED.set_footer(text="Your role preferences determine which break requests you see.")
+
+# Break board positions: guild config role key -> button/display label, in button order
+_ROLE_LABELS = {
+    "gnd_unrestricted": "Unrestricted GND",
+    "gnd_tier1": "Tier 1 GND",
+    "twr_unrestricted": "Unrestricted TWR",
+    "twr_tier1": "Tier 1 TWR",
+    "app_unrestricted": "Unrestricted APP",
+    "pct": "PCT",
+    "center": "Center",
+}
+
+# Channel messages for break requests and claims
+_NOTIFY_TMPL = (
+    "{role_mention} **{role_name} break request!** "
+    "Controller {user_mention} is requesting a relief for {role_name}. They can wait {wait_time}."
+)
+_CLAIM_TMPL = "🚨 {reliever} has claimed the position for {requester}! Please coordinate directly."
+_CLAIM_ORPHAN_TMPL = "🚨 {reliever} has claimed this break! The original requester is no longer in the server."
+
 # We'll store message ids per guild to avoid cross-guild collisions.
 def _role_selector_file_for_guild(guild_id: int):
     return f"{os.getcwd()}/data/breakboard_selector_message_id_{guild_id}.json"
@@ -13,19 +102,117 @@ def _role_selector_file_for_guild(guild_id: int):
 def _notification_file_for_guild(guild_id: int):
     return f"{os.getcwd()}/data/notification_message_id_{guild_id}.json"
 
+def _read_message_id(path: str):
+    """Return the message id stored at `path`, or None if the file is missing or unreadable."""
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read()).get("message_id")
+    except FileNotFoundError:
+        return None
+    except Exception:
+        logger.debug("Could not read stored message id from %s", path, exc_info=True)
+        return None
+
+def _write_message_id(path: str, message_id: int, channel_id: int):
+    """Persist a message/channel id pair; blocking, so callers run it via asyncio.to_thread.
+
+    Written to a temp file and renamed over the target, so a crash mid-write can never leave a
+    truncated file behind.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(orjson.dumps({"message_id": message_id, "channel_id": channel_id}))
+    os.replace(tmp_path, path)
+
+
+# Seconds of quiet after a save before the queued message ids are written out
+_SAVE_DEBOUNCE = 0.2
+
+
+class _MessageIdWriter:
+    """Debounced background writer for the per-guild message id files.
+
+    Saves queued in quick succession (e.g. several guilds posting on ready) are coalesced so
+    each file is written once with its latest value.
+    """
+
+    def __init__(self):
+        self._queue = asyncio.Queue()
+        self._task = None
+        # path -> (message_id, channel_id) queued but not yet handed to a write
+        self._pending = {}
+        # the write currently running in a worker thread, if any
+        self._inflight = None
+        # path -> (message_id, channel_id) last written, so repeat saves of the same ids cost nothing
+        self._written = {}
+
+    def save(self, path: str, message_id: int, channel_id: int):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        self._queue.put_nowait((path, message_id, channel_id))
+
+    async def _run(self):
+        while True:
+            path, message_id, channel_id = await self._queue.get()
+            self._pending[path] = (message_id, channel_id)
+            while True:
+                try:
+                    path, message_id, channel_id = await asyncio.wait_for(self._queue.get(), _SAVE_DEBOUNCE)
+                except asyncio.TimeoutError:
+                    break
+                self._pending[path] = (message_id, channel_id)
+            batch, self._pending = self._pending, {}
+            # Shielded so cancelling this task never abandons a batch mid-write; close() awaits it
+            self._inflight = asyncio.ensure_future(asyncio.to_thread(self._write_all, batch))
+            await asyncio.shield(self._inflight)
+
+    def _write_all(self, batch: dict):
+        for path, ids in batch.items():
+            if self._written.get(path) == ids:
+                continue
+            try:
+                _write_message_id(path, *ids)
+            except Exception:
+                logger.exception("Failed to persist message id to %s", path)
+            else:
+                self._written[path] = ids
+
+    async def close(self):
+        """Stop the writer and flush everything still queued, without blocking the event loop."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._inflight is not None:
+            try:
+                await self._inflight
+            except Exception:
+                logger.exception("Message id write failed during shutdown")
+            self._inflight = None
+        while not self._queue.empty():
+            path, message_id, channel_id = self._queue.get_nowait()
+            self._pending[path] = (message_id, channel_id)
+        batch, self._pending = self._pending, {}
+        if batch:
+            await asyncio.to_thread(self._write_all, batch)
+
 class BreakRequestActions(discord.ui.View):
     def __init__(self, request_user_id: int):
         super().__init__(timeout=3600)
         self.request_user_id = request_user_id
 
     async def on_timeout(self):
-        for item in self.children:
-            item.disabled = True
-        if self.message:
-            await self.message.edit(view=self)
+        # Strip the components outright; an empty view is a smaller edit than re-sending disabled buttons
+        message = getattr(self, "message", None)
+        if message:
+            await message.edit(view=None)
 
     async def on_error(self, interaction: discord.Interaction, error: Exception, item: discord.ui.Item):
-        logger.info(f"Error during BreakRequestActions interaction for {item.custom_id}: {error}")
+        logger.info("Error during BreakRequestActions interaction for %s: %s", item.custom_id, error)
         if not interaction.response.is_done():
             await interaction.response.send_message("An error occurred with this action.", ephemeral=True)
         else:
@@ -40,22 +227,20 @@ class BreakRequestActions(discord.ui.View):
 
         if requesting_user:
             await interaction.channel.send(
-                f"🚨 {reliever_user.mention} has claimed the position for {requesting_user.mention}! "
-                "Please coordinate directly.",
+                _CLAIM_TMPL.format(reliever=reliever_user.mention, requester=requesting_user.mention),
                 view=NotificationDeleteView(reliever_user.id)
             )
 
             try:
                 await interaction.message.delete()
             except Exception as e:
-                logger.error(f"Error deleting break request message after claim: {e}")
+                logger.error("Error deleting break request message after claim: %s", e)
         else:
-            await interaction.channel.send(
-                f"🚨 {reliever_user.mention} has claimed this break! The original requester is no longer in the server."
-            )
+            await interaction.channel.send(_CLAIM_ORPHAN_TMPL.format(reliever=reliever_user.mention))
+            # the request message stays up, so take its buttons away
+            await interaction.message.edit(view=None)
 
-        for item in self.children:
-            item.disabled = True
+        self.stop()
 
     @discord.ui.button(label="Done / Delete", style=discord.ButtonStyle.danger, custom_id="delete_break_request")
     async def delete_button(self, interaction: discord.Interaction, button: discord.ui.Button  ):
@@ -72,13 +257,13 @@ class BreakRequestActions(discord.ui.View):
 
         try:
             await interaction.message.delete()
-            logger.info(f"Break request message deleted by {interaction.user.name}.")
+            logger.info("Break request message deleted by %s.", interaction.user.name)
 
         except discord.Forbidden:
             await interaction.followup.send("I don't have permission to delete this message.", ephemeral=True)
         except Exception as e:
             await interaction.followup.send(f"Failed to delete message: {e}", ephemeral=True)
-            logger.info(f"Error deleting break request message: {e}")
+            logger.info("Error deleting break request message: %s", e)
 
 
 class BreakTimeModal(discord.ui.Modal, title="Break Request Details"):
@@ -103,15 +288,13 @@ class BreakTimeModal(discord.ui.Modal, title="Break Request Details"):
 
         wait_time_display = "no specific time"
         if wait_time_raw:
-            if re.match(r"^\d+\s*(m|min|minute(s)?|h|hr|hour(s)?)((\s+)?\d+\s*(m|min|minute(s)?))?$", wait_time_raw,
-                        re.IGNORECASE):
+            if _parse_wait_time(wait_time_raw) is not None:
                 wait_time_display = f"for **{wait_time_raw}**"
             else:
                 await interaction.followup.send(
                     f"Invalid time format: `{wait_time_raw}`. Please use formats like '15 minutes', '1h', '30m'. "
                     f"Sending request without specific time.", ephemeral=True
                 )
-                wait_time_display = "no specific time"
 
         break_board_cog = self.bot_instance.get_cog("BreakBoard")
         if break_board_cog:
@@ -128,7 +311,7 @@ class BreakTimeModal(discord.ui.Modal, title="Break Request Details"):
             )
 
     async def on_error(self, interaction: discord.Interaction, error: Exception):
-        logger.info(f"Error submitting modal for {self.role_name}: {error}")
+        logger.info("Error submitting modal for %s: %s", self.role_name, error)
         if not interaction.response.is_done():
             await interaction.response.send_message("An error occurred while processing your request.", ephemeral=True)
         else:
@@ -139,54 +322,27 @@ class BreakBoardButtons(discord.ui.View):
     def __init__(self, bot):
         super().__init__(timeout=None)
         self.bot = bot
+        # the role key doubles as the button's persistent custom_id
+        for key, label in _ROLE_LABELS.items():
+            button = discord.ui.Button(label=label, style=discord.ButtonStyle.blurple, custom_id=key)
+            button.callback = functools.partial(self._open_modal, role_name=label, role_key=key)
+            self.add_item(button)
 
     async def on_error(self, interaction: discord.Interaction, error: Exception, item: discord.ui.Item):
-        logger.info(f"Error during button interaction for {item.custom_id}: {error}")
+        logger.info("Error during button interaction for %s: %s", item.custom_id, error)
         if not interaction.response.is_done():
             await interaction.response.send_message("An error occurred with this button.", ephemeral=True)
         else:
             await interaction.followup.send("An error occurred after acknowledging this button click.", ephemeral=True)
 
-    @discord.ui.button(label="Unrestricted GND", style=discord.ButtonStyle.blurple, custom_id="gnd_unrestricted")
-    async def gnd_unrestricted_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "gnd_unrestricted")
-        modal = BreakTimeModal(self.bot, "Unrestricted GND", role_id)
-        await interaction.response.send_modal(modal)
-
-    @discord.ui.button(label="Tier 1 GND", style=discord.ButtonStyle.blurple, custom_id="gnd_tier1")
-    async def gnd_tier1_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "gnd_tier1")
-        modal = BreakTimeModal(self.bot, "Tier 1 GND", role_id)
-        await interaction.response.send_modal(modal)
-
-    @discord.ui.button(label="Unrestricted TWR", style=discord.ButtonStyle.blurple, custom_id="twr_unrestricted")
-    async def twr_unrestricted_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "twr_unrestricted")
-        modal = BreakTimeModal(self.bot, "Unrestricted TWR", role_id)
-        await interaction.response.send_modal(modal)
-
-    @discord.ui.button(label="Tier 1 TWR", style=discord.ButtonStyle.blurple, custom_id="twr_tier1")
-    async def twr_tier1_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "twr_tier1")
-        modal = BreakTimeModal(self.bot, "Tier 1 TWR", role_id)
-        await interaction.response.send_modal(modal)
-
-    @discord.ui.button(label="Unrestricted APP", style=discord.ButtonStyle.blurple, custom_id="app_unrestricted")
-    async def app_unrestricted_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "app_unrestricted")
-        modal = BreakTimeModal(self.bot, "Unrestricted APP", role_id)
-        await interaction.response.send_modal(modal)
-
-    @discord.ui.button(label="PCT", style=discord.ButtonStyle.blurple, custom_id="pct")
-    async def pct_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "pct")
-        modal = BreakTimeModal(self.bot, "PCT", role_id)
-        await interaction.response.send_modal(modal)
-
-    @discord.ui.button(label="Center", style=discord.ButtonStyle.blurple, custom_id="center")
-    async def center_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "center")
-        modal = BreakTimeModal(self.bot, "Center", role_id)
+    async def _open_modal(self, interaction: discord.Interaction, *, role_name: str, role_key: str):
+        role_id = cfg.get_role_for_guild(interaction.guild.id, role_key)
+        # Fail before building the modal rather than after the user has filled it in
+        if role_id is None or interaction.guild.get_role(role_id) is None:
+            await interaction.response.send_message(
+                f"Error: Role for '{role_name}' not found. Please contact an administrator.", ephemeral=True)
+            return
+        modal = BreakTimeModal(self.bot, role_name, role_id)
         await interaction.response.send_modal(modal)
 
 
@@ -194,14 +350,20 @@ class BreakBoard(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
         # message ids are tracked per-guild; not loaded globally here
+        # The buttons view is stateless and persistent, so one instance serves every guild's message
+        self._buttons_view = BreakBoardButtons(bot)
+        self._writer = _MessageIdWriter()
+        # guilds whose board is already posted/attached this process; on_ready re-fires on every
+        # reconnect and the registered view survives it, so those guilds need no REST calls
+        self._initialized_guilds = set()
         logger.info("BreakBoard cog initialized.")
 
     def save_message_id(self, message_id: int, channel_id: int, guild_id: int):
-        # persist the message id and channel id for this guild only
-        path = _notification_file_for_guild(guild_id)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w") as f:
-            json.dump({"message_id": message_id, "channel_id": channel_id}, f)
+        # persist the message id and channel id for this guild only (debounced, off the event loop)
+        self._writer.save(_notification_file_for_guild(guild_id), message_id, channel_id)
+
+    async def cog_unload(self):
+        await self._writer.close()
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -212,20 +374,23 @@ class BreakBoard(commands.Cog):
 
         # Initialize per-guild behavior for every guild the bot is in.
         for guild in self.bot.guilds:
+            if guild.id in self._initialized_guilds:
+                continue
             # Diagnostic: log guild and cwd info to help trace why channels may not be found
-            logger.debug(f"Initializing BreakBoard for guild: id={guild.id}, name='{guild.name}', cwd={os.getcwd()}")
+            logger.debug("Initializing BreakBoard for guild: id=%s, name='%s', cwd=%s", guild.id, guild.name, os.getcwd())
             guild_cfg = cfg.get_guild_config(guild.id)
-            try:
-                cfg_snapshot = guild_cfg.as_dict()
-            except Exception:
-                cfg_snapshot = {}
-            logger.debug(f"Guild config snapshot for {guild.id}: {cfg_snapshot}")
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    cfg_snapshot = guild_cfg.as_dict()
+                except Exception:
+                    cfg_snapshot = {}
+                logger.debug("Guild config snapshot for %s: %s", guild.id, cfg_snapshot)
 
             channel_id = guild_cfg.get_channel("break_board_channel_id")
-            logger.debug(f"Resolved break_board_channel_id for guild {guild.id}: {channel_id} (type={type(channel_id)})")
+            logger.debug("Resolved break_board_channel_id for guild %s: %s (type=%s)", guild.id, channel_id, type(channel_id))
 
             if not channel_id:
-                logger.info(f"No breakboard channel configured for guild {guild.id} ({guild.name}), skipping.")
+                logger.info("No breakboard channel configured for guild %s (%s), skipping.", guild.id, guild.name)
                 continue
 
             # Try to locate the channel: prefer guild cache then global cache, then fetch
@@ -234,64 +399,46 @@ class BreakBoard(commands.Cog):
                 try:
                     channel = await self.bot.fetch_channel(channel_id)
                 except discord.NotFound:
-                    logger.info(f"BreakBoard channel with ID {channel_id} not found in guild {guild.id} ({guild.name}).")
+                    logger.info("BreakBoard channel with ID %s not found in guild %s (%s).", channel_id, guild.id, guild.name)
                     # Log available text channels in the guild to help debugging
-                    try:
-                        available = ", ".join([f"{c.name}({c.id})" for c in guild.text_channels])
-                        logger.debug(f"Guild {guild.id} text channels: {available}")
-                    except Exception:
-                        logger.debug("Could not list guild text channels for debugging.")
+                    _log_text_channels(guild)
                     continue
                 except discord.Forbidden:
-                    logger.info(f"Bot doesn't have permission to fetch channel {channel_id} in guild {guild.id} ({guild.name}).")
-                    try:
-                        available = ", ".join([f"{c.name}({c.id})" for c in guild.text_channels])
-                        logger.debug(f"Guild {guild.id} text channels: {available}")
-                    except Exception:
-                        logger.debug("Could not list guild text channels for debugging.")
+                    logger.info("Bot doesn't have permission to fetch channel %s in guild %s (%s).", channel_id, guild.id, guild.name)
+                    _log_text_channels(guild)
                     continue
                 except Exception as e:
-                    logger.exception(f"Unexpected error while fetching breakboard channel {channel_id} for guild {guild.id}: {e}")
-                    try:
-                        available = ", ".join([f"{c.name}({c.id})" for c in guild.text_channels])
-                        logger.debug(f"Guild {guild.id} text channels: {available}")
-                    except Exception:
-                        logger.debug("Could not list guild text channels for debugging.")
+                    logger.exception("Unexpected error while fetching breakboard channel %s for guild %s: %s", channel_id, guild.id, e)
+                    _log_text_channels(guild)
                     continue
 
-            logger.info(f"Located breakboard channel {channel.name} (ID: {channel.id}) in guild {guild.id} ({guild.name}).")
+            logger.info("Located breakboard channel %s (ID: %s) in guild %s (%s).", channel.name, channel.id, guild.id, guild.name)
 
             # Ensure we have a text channel — warn if it's not what we expect
             if not isinstance(channel, discord.abc.Messageable) and not isinstance(channel, discord.TextChannel):
-                logger.warning(f"Configured breakboard channel {channel_id} exists but is not a text channel: {type(channel)}")
+                logger.warning("Configured breakboard channel %s exists but is not a text channel: %s", channel_id, type(channel))
                 continue
 
             # Attempt to re-attach view to a persisted message if present
             # The BreakBoard uses the notification file to persist its message id
-            msg_file = _notification_file_for_guild(guild.id)
-            saved_message_id = None
-            if os.path.exists(msg_file):
-                try:
-                    with open(msg_file, "r") as f:
-                        data = json.load(f)
-                        saved_message_id = data.get("message_id")
-                except Exception:
-                    saved_message_id = None
+            saved_message_id = _read_message_id(_notification_file_for_guild(guild.id))
 
             if saved_message_id:
                 try:
                     message = await channel.fetch_message(saved_message_id)
-                    self.bot.add_view(BreakBoardButtons(self.bot), message_id=message.id)
-                    logger.info(f"Found existing BreakBoard message (ID: {saved_message_id}) for guild {guild.id}. Re-attaching view.")
+                    self.bot.add_view(self._buttons_view, message_id=message.id)
+                    logger.info("Found existing BreakBoard message (ID: %s) for guild %s. Re-attaching view.", saved_message_id, guild.id)
+                    self._initialized_guilds.add(guild.id)
                     continue
                 except discord.NotFound:
                     logger.info("Previous BreakBoard message not found. Sending a new one.")
                 except discord.Forbidden:
-                    logger.info(f"Bot doesn't have permission to fetch message {saved_message_id} in channel {channel_id}.")
+                    logger.info("Bot doesn't have permission to fetch message %s in channel %s.", saved_message_id, channel_id)
                 except Exception as e:
-                    logger.exception(f"Unexpected error while fetching stored BreakBoard message {saved_message_id} for guild {guild.id}: {e}")
+                    logger.exception("Unexpected error while fetching stored BreakBoard message %s for guild %s: %s", saved_message_id, guild.id, e)
 
             await self.send_initial_embed_with_buttons(channel)
+            self._initialized_guilds.add(guild.id)
 
     async def send_notification(self, interaction: discord.Interaction, role_name: str, role_id: int,
                                 wait_time: str = "no specific time"):
@@ -303,10 +450,8 @@ class BreakBoard(commands.Cog):
                 f"Error: Role for '{role_name}' not found. Please contact an administrator.", ephemeral=True)
             return
 
-        user_mention = interaction.user.mention
-        message_to_send = (
-            f"{role.mention} **{role_name} break request!** "
-            f"Controller {user_mention} is requesting a relief for {role_name}. They can wait {wait_time}."
+        message_to_send = _NOTIFY_TMPL.format(
+            role_mention=role.mention, role_name=role_name, user_mention=interaction.user.mention, wait_time=wait_time
         )
 
         try:
@@ -318,28 +463,17 @@ class BreakBoard(commands.Cog):
 
         except Exception as e:
             await interaction.followup.send(f"Failed to send notification: {e}", ephemeral=True)
-            logger.info(f"Failed to send notification for {role_name} (Role ID: {role_id}): {e}")
+            logger.info("Failed to send notification for %s (Role ID: %s): %s", role_name, role_id, e)
 
     async def send_initial_embed_with_buttons(self, channel: discord.TextChannel):
-        embed = discord.Embed(
-            title="Controller Break Notification System",
-            description=(
-                "Use the buttons below to request a break for specific positions.\n"
-                "- The message will include a 'Claim' and 'Done / Delete' button."
-                "- Press the 'Complete' button to delete the message when the shift change is complete."
-            ),
-            color=discord.Color.blue()
-        )
-
-        view = BreakBoardButtons(self.bot)
-        message = await channel.send(embed=embed, view=view)
+        message = await channel.send(embed=_BREAKBOARD_EMBED, view=self._buttons_view)
         # persist per-guild role selector message id
         try:
             guild_id = channel.guild.id
             self.save_message_id(message.id, channel.id, guild_id)
         except Exception:
             logger.info("Could not persist breakboard message id for guild.")
-        logger.info(f"Sent new BreakBoard message (ID: {message.id}) in channel {channel.name}.")
+        logger.info("Sent new BreakBoard message (ID: %s) in channel %s.", message.id, channel.name)
 
 
 class NotificationDeleteView(discord.ui.View):
@@ -368,9 +502,13 @@ class RoleSelectionButtons(discord.ui.View):
     def __init__(self, bot):
         super().__init__(timeout=None)
         self.bot = bot
+        for key, label in _ROLE_LABELS.items():
+            button = discord.ui.Button(label=label, style=discord.ButtonStyle.secondary, custom_id=f"role_{key}")
+            button.callback = functools.partial(self._toggle_role, role_name=label, role_key=key)
+            self.add_item(button)
 
     async def on_error(self, interaction: discord.Interaction, error: Exception, item: discord.ui.Item):
-        logger.info(f"Error during role selection interaction for {item.custom_id}: {error}")
+        logger.info("Error during role selection interaction for %s: %s", item.custom_id, error)
         await interaction.response.send_message("An error occurred while processing your role request.", ephemeral=True)
 
     async def assign_or_remove_role(self, interaction: discord.Interaction, role_name_display: str, role_id: int):
@@ -403,40 +541,9 @@ class RoleSelectionButtons(discord.ui.View):
             except Exception as e:
                 await interaction.followup.send(f"An error occurred while adding the role: {e}", ephemeral=True)
 
-    @discord.ui.button(label="Unrestricted GND", style=discord.ButtonStyle.secondary, custom_id="role_gnd_unrestricted")
-    async def gnd_unrestricted_role_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "gnd_unrestricted")
-        await self.assign_or_remove_role(interaction, "Unrestricted GND", role_id)
-
-    @discord.ui.button(label="Tier 1 GND", style=discord.ButtonStyle.secondary, custom_id="role_gnd_tier1")
-    async def gnd_tier1_role_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "gnd_tier1")
-        await self.assign_or_remove_role(interaction, "Tier 1 GND", role_id)
-
-    @discord.ui.button(label="Unrestricted TWR", style=discord.ButtonStyle.secondary, custom_id="role_twr_unrestricted")
-    async def twr_unrestricted_role_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "twr_unrestricted")
-        await self.assign_or_remove_role(interaction, "Unrestricted TWR", role_id)
-
-    @discord.ui.button(label="Tier 1 TWR", style=discord.ButtonStyle.secondary, custom_id="role_twr_tier1")
-    async def twr_tier1_role_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "twr_tier1")
-        await self.assign_or_remove_role(interaction, "Tier 1 TWR", role_id)
-
-    @discord.ui.button(label="Unrestricted APP", style=discord.ButtonStyle.secondary, custom_id="role_app_unrestricted")
-    async def app_unrestricted_role_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "app_unrestricted")
-        await self.assign_or_remove_role(interaction, "Unrestricted APP", role_id)
-
-    @discord.ui.button(label="PCT", style=discord.ButtonStyle.secondary, custom_id="role_pct")
-    async def pct_role_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "pct")
-        await self.assign_or_remove_role(interaction, "PCT", role_id)
-
-    @discord.ui.button(label="Center", style=discord.ButtonStyle.secondary, custom_id="role_center")
-    async def center_role_button(self, interaction: discord.Interaction, button: discord.ui.Button):
-        role_id = cfg.get_role_for_guild(interaction.guild.id, "center")
-        await self.assign_or_remove_role(interaction, "Center", role_id)
+    async def _toggle_role(self, interaction: discord.Interaction, *, role_name: str, role_key: str):
+        role_id = cfg.get_role_for_guild(interaction.guild.id, role_key)
+        await self.assign_or_remove_role(interaction, role_name, role_id)
 
 
 class RoleSelector(commands.Cog):
@@ -445,15 +552,20 @@ class RoleSelector(commands.Cog):
         # message ids handled per-guild; nothing to preload here
         self.message_id = None
         self.channel_id = None
+        # stateless persistent view shared by every guild's selector message (see BreakBoard)
+        self._buttons_view = RoleSelectionButtons(bot)
+        self._writer = _MessageIdWriter()
+        # guilds whose selector is already posted/attached this process (see BreakBoard)
+        self._initialized_guilds = set()
         # ensure data directory exists
         os.makedirs(os.path.join(os.getcwd(), "data"), exist_ok=True)
 
     def save_message_id(self, message_id: int, channel_id: int, guild_id: int):
-        # save per-guild role selector message id
-        path = _role_selector_file_for_guild(guild_id)
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w") as f:
-            json.dump({"message_id": message_id, "channel_id": channel_id}, f)
+        # save per-guild role selector message id (debounced, off the event loop)
+        self._writer.save(_role_selector_file_for_guild(guild_id), message_id, channel_id)
+
+    async def cog_unload(self):
+        await self._writer.close()
 
     @commands.Cog.listener()
     async def on_ready(self):
@@ -462,19 +574,22 @@ class RoleSelector(commands.Cog):
 
         logger.info("RoleSelector cog ready.")
         for guild in self.bot.guilds:
+            if guild.id in self._initialized_guilds:
+                continue
             # Diagnostic logging similar to BreakBoard to help debugging
-            logger.debug(f"Initializing RoleSelector for guild: id={guild.id}, name='{guild.name}', cwd={os.getcwd()}")
+            logger.debug("Initializing RoleSelector for guild: id=%s, name='%s', cwd=%s", guild.id, guild.name, os.getcwd())
             guild_cfg = cfg.get_guild_config(guild.id)
-            try:
-                cfg_snapshot = guild_cfg.as_dict()
-            except Exception:
-                cfg_snapshot = {}
-            logger.debug(f"Guild config snapshot for {guild.id}: {cfg_snapshot}")
+            if logger.isEnabledFor(logging.DEBUG):
+                try:
+                    cfg_snapshot = guild_cfg.as_dict()
+                except Exception:
+                    cfg_snapshot = {}
+                logger.debug("Guild config snapshot for %s: %s", guild.id, cfg_snapshot)
 
             channel_id = guild_cfg.get_channel("break_board_channel_id")
-            logger.debug(f"Resolved break_board_channel_id for RoleSelector in guild {guild.id}: {channel_id} (type={type(channel_id)})")
+            logger.debug("Resolved break_board_channel_id for RoleSelector in guild %s: %s (type=%s)", guild.id, channel_id, type(channel_id))
             if not channel_id:
-                logger.info(f"No role selector channel configured for guild {guild.id} ({guild.name}), skipping.")
+                logger.info("No role selector channel configured for guild %s (%s), skipping.", guild.id, guild.name)
                 continue
 
             # Prefer guild.get_channel before bot.get_channel when resolving the configured channel ID
@@ -483,76 +598,45 @@ class RoleSelector(commands.Cog):
                 try:
                     channel = await self.bot.fetch_channel(channel_id)
                 except discord.NotFound:
-                    logger.info(f"Role Selector channel with ID {channel_id} not found in guild {guild.id}.")
-                    try:
-                        available = ", ".join([f"{c.name}({c.id})" for c in guild.text_channels])
-                        logger.debug(f"Guild {guild.id} text channels: {available}")
-                    except Exception:
-                        logger.debug("Could not list guild text channels for debugging.")
+                    logger.info("Role Selector channel with ID %s not found in guild %s.", channel_id, guild.id)
+                    _log_text_channels(guild)
                     continue
                 except discord.Forbidden:
-                    logger.info(f"Bot doesn't have permission to fetch channel {channel_id} in guild {guild.id}.")
-                    try:
-                        available = ", ".join([f"{c.name}({c.id})" for c in guild.text_channels])
-                        logger.debug(f"Guild {guild.id} text channels: {available}")
-                    except Exception:
-                        logger.debug("Could not list guild text channels for debugging.")
+                    logger.info("Bot doesn't have permission to fetch channel %s in guild %s.", channel_id, guild.id)
+                    _log_text_channels(guild)
                     continue
                 except Exception as e:
-                    logger.exception(f"Unexpected error while fetching role selector channel {channel_id} for guild {guild.id}: {e}")
-                    try:
-                        available = ", ".join([f"{c.name}({c.id})" for c in guild.text_channels])
-                        logger.debug(f"Guild {guild.id} text channels: {available}")
-                    except Exception:
-                        logger.debug("Could not list guild text channels for debugging.")
+                    logger.exception("Unexpected error while fetching role selector channel %s for guild %s: %s", channel_id, guild.id, e)
+                    _log_text_channels(guild)
                     continue
 
             # try per-guild saved message
-            msg_file = _role_selector_file_for_guild(guild.id)
-            saved_message_id = None
-            if os.path.exists(msg_file):
-                try:
-                    with open(msg_file, "r") as f:
-                        data = json.load(f)
-                        saved_message_id = data.get("message_id")
-                except Exception:
-                    saved_message_id = None
+            saved_message_id = _read_message_id(_role_selector_file_for_guild(guild.id))
 
             if saved_message_id:
                 try:
                     message = await channel.fetch_message(saved_message_id)
-                    self.bot.add_view(RoleSelectionButtons(self.bot), message_id=message.id)
-                    logger.info(f"Found existing role selector message (ID: {saved_message_id}) for guild {guild.id}. Re-attaching view.")
+                    self.bot.add_view(self._buttons_view, message_id=message.id)
+                    logger.info("Found existing role selector message (ID: %s) for guild %s. Re-attaching view.", saved_message_id, guild.id)
+                    self._initialized_guilds.add(guild.id)
                     continue
                 except discord.NotFound:
                     logger.info("Previous role selector message not found. Sending a new one.")
                 except discord.Forbidden:
-                    logger.info(f"Bot doesn't have permission to fetch message {saved_message_id} in channel {channel_id}.")
+                    logger.info("Bot doesn't have permission to fetch message %s in channel %s.", saved_message_id, channel_id)
                 except Exception as e:
-                    logger.exception(f"Unexpected error while fetching stored role selector message {saved_message_id} for guild {guild.id}: {e}")
+                    logger.exception("Unexpected error while fetching stored role selector message %s for guild %s: %s", saved_message_id, guild.id, e)
             await self.send_initial_embed_with_buttons(channel)
+            self._initialized_guilds.add(guild.id)
 
     async def send_initial_embed_with_buttons(self, channel: discord.TextChannel):
-        embed = discord.Embed(
-            title="🔔 Controller Notification Preferences 🔔",
-            description=(
-                "Click the buttons below to **opt in or out** of receiving notifications "
-                "when controllers request a break for specific positions.\n\n"
-                "• If you have the role, clicking the button will **remove** it.\n"
-                "• If you don't have the role, clicking the button will **add** it."
-            ),
-            color=discord.Color.gold()
-        )
-        embed.set_footer(text="Your role preferences determine which break requests you see.")
-
-        view = RoleSelectionButtons(self.bot)
-        message = await channel.send(embed=embed, view=view)
+        message = await channel.send(embed=_ROLE_SELECTOR_EMBED, view=self._buttons_view)
         try:
             guild_id = channel.guild.id
             self.save_message_id(message.id, channel.id, guild_id)
         except Exception:
             logger.info("Could not persist role selector message id for guild.")
-        logger.info(f"Sent new role selector message (ID: {message.id}) in channel {channel.name}.")
+        logger.info("Sent new role selector message (ID: %s) in channel %s.", message.id, channel.name)
 
 
 async def setup(bot):
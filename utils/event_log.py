@@ -1,13 +1,21 @@
 # ...existing code...
-import json
+import copy
+import orjson
 import os
 import tempfile
 import fcntl
+import threading
 import typing as t
 import re
 from datetime import datetime, timezone
 
 
+# Process-wide cache of parsed logs: path -> (st_mtime_ns, data). Lets repeated loads
+# skip re-reading and re-parsing the file when it hasn't changed on disk.
+_LOG_CACHE: dict = {}
+_LOG_CACHE_LOCK = threading.Lock()
+
+
 def _log_filepath(guild_id: t.Optional[int]) -> str:
     """Return the filepath for the guild-specific or global event posting log."""
     base_dir = os.path.join(os.path.dirname(__file__), "..", "data")
@@ -50,10 +58,17 @@ def make_event_key(event_id: t.Optional[t.Union[str, int]], event_title: t.Optio
 def load_log(guild_id: t.Optional[int]) -> dict:
     """Load the log JSON and return as a dict. Returns empty dict if file missing or invalid."""
     path = _log_filepath(guild_id)
-    if not os.path.exists(path):
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
         return {}
+    with _LOG_CACHE_LOCK:
+        cached = _LOG_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        # deep copy so callers can edit entries, nested ones included, without touching the cache
+        return copy.deepcopy(cached[1])
     try:
-        with open(path, "r", encoding="utf-8") as fh:
+        with open(path, "rb") as fh:
             try:
                 # use shared lock while reading
                 try:
@@ -61,14 +76,16 @@ def load_log(guild_id: t.Optional[int]) -> dict:
                 except Exception:
                     # if flock unavailable, proceed without it
                     pass
-                data = json.load(fh)
+                data = orjson.loads(fh.read())
             finally:
                 try:
                     fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
                 except Exception:
                     pass
         if isinstance(data, dict):
-            return data
+            with _LOG_CACHE_LOCK:
+                _LOG_CACHE[path] = (mtime_ns, data)
+            return copy.deepcopy(data)
     except Exception:
         # Corrupt file or other IO problem -> return empty and caller may overwrite
         return {}
@@ -88,24 +105,23 @@ def save_log(guild_id: t.Optional[int], data: dict) -> None:
     # Write JSON to a temp file then atomically replace
     tmp_fd, tmp_path = tempfile.mkstemp(prefix=".tmp_event_log_", dir=ddir)
     try:
-        with os.fdopen(tmp_fd, "w", encoding="utf-8") as fh:
-            # acquire exclusive lock on temp file while writing
-            try:
-                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
-            except Exception:
-                pass
-            json.dump(data, fh, indent=2, ensure_ascii=False)
+        # mkstemp's file is private to this call, so it needs no lock; readers only
+        # ever see the finished file via os.replace.
+        with os.fdopen(tmp_fd, "wb") as fh:
+            fh.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
             fh.flush()
             try:
                 os.fsync(fh.fileno())
             except Exception:
                 pass
-            try:
-                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
-            except Exception:
-                pass
-        # replace target
-        os.replace(tmp_path, path)
+            # os.replace keeps the inode's mtime, so this is the target's mtime once renamed
+            mtime_ns = os.fstat(fh.fileno()).st_mtime_ns
+        cached = copy.deepcopy(data)
+        # Replace and cache update happen together so a concurrent save can't interleave
+        # and leave its payload cached under the other writer's mtime.
+        with _LOG_CACHE_LOCK:
+            os.replace(tmp_path, path)
+            _LOG_CACHE[path] = (mtime_ns, cached)
     except Exception:
         # cleanup temp file on failure
         try:
@@ -1,3 +1,17 @@
+# Underscore-less position names (named sectors/splits) and the category they staff
+_APP_SECTORS = frozenset({
+    "DCAFR", "KRANT", "LURAY", "OJAAY", "TYSON", "ASPER", "BARIN", "IADFC", "IADFE",
+    "IADFW", "MANNE", "MULRR", "TAPPA", "RICFR", "FLTRK", "CSIDW", "CSIDE", "CHOWE",
+    "CHOEA", "WOOLY", "GRACO", "BWFIS", "BUFFR", "KRANT + TYSON", "MANNE + BARIN", "PACMAN",
+})
+_NAMED_POSITIONS = {
+    **dict.fromkeys(_APP_SECTORS, "APP"),
+    "TMU": "TMU",
+    "CIC": "CIC",
+    "PCT CIC": "CIC",
+}
+
+
 def parse_position(position_str: str) -> str:
     position_str = position_str.strip().split("_")
     if len(position_str) > 2:
@@ -6,66 +20,7 @@ def parse_position(position_str: str) -> str:
     elif len(position_str) == 2:
         category = position_str[1]
         return category
-    elif position_str == ["DCAFR"] :
-        return "APP"
-    elif position_str == ["KRANT"]:
-        return "APP"
-    elif position_str == ["LURAY"]:
-        return "APP"
-    elif position_str == ["OJAAY"]:
-        return "APP"
-    elif position_str == ["TYSON"]:
-        return "APP"
-    elif position_str == ["ASPER"]:
-        return "APP"
-    elif position_str == ["BARIN"]:
-        return "APP"
-    elif position_str == ["IADFC"]:
-        return "APP"
-    elif position_str == ["IADFE"]:
-        return "APP"
-    elif position_str == ["IADFW"]:
-        return "APP"
-    elif position_str == ["MANNE"]:
-        return "APP"
-    elif position_str == ["MULRR"]:
-        return "APP"
-    elif position_str == ["TAPPA"]:
-        return "APP"
-    elif position_str == ["RICFR"]:
-        return "APP"
-    elif position_str == ["FLTRK"]:
-        return "APP"
-    elif position_str == ["CSIDW"]:
-        return "APP"
-    elif position_str == ["CSIDE"]:
-        return "APP"
-    elif position_str == ["CHOWE"]:
-        return "APP"
-    elif position_str == ["CHOEA"]:
-        return "APP"
-    elif position_str == ["WOOLY"]:
-        return "APP"
-    elif position_str == ["GRACO"]:
-        return "APP"
-    elif position_str == ["BWFIS"]:
-        return "APP"
-    elif position_str == ["BUFFR"]:
-        return "APP"
-    elif position_str == ["KRANT + TYSON"]:
-        return "APP"
-    elif position_str == ["MANNE + BARIN"]:
-        return "APP"
-    elif position_str == ["TMU"]:
-        return "TMU"
-    elif position_str == ["CIC"]:
-        return "CIC"
-    elif position_str == ["PCT CIC"]:
-        return "CIC"
-    elif position_str == ["PACMAN"]:
-        return "APP"
-    else:
-        return "UNKNOWN"
+    return _NAMED_POSITIONS.get(position_str[0], "UNKNOWN")
 
 if __name__ == "__main__":
     print(parse_position("IAD_APP"))